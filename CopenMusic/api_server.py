@@ -2,56 +2,318 @@
 """
 Simple API server to serve concert data via HTTP endpoint
 Run with: python3 api_server.py
+
+Requests are handled on threads. concerts.json is kept in memory (raw and
+gzip-compressed) and only reloaded when the file's modification time
+changes; responses carry an ETag so clients can revalidate with
+If-None-Match and get a 304.
+
+/concerts with query parameters (venue, from, to, status, limit, cursor)
+answers from a ConcertIndex built once per snapshot instead of sending the
+whole file.
+
+Run with --mode async for the asyncio server in api_stream.py, which adds
+live updates at /concerts/stream.
 """
 
+import argparse
+import asyncio
+import gzip
+import hashlib
 import json
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-import socket
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from concert_index import QUERY_PARAMS, ConcertIndex, QueryError, parse_query
+from search_index import SearchIndex
+
+DATA_PATH = 'output/concerts.json'
+# Written next to concerts.json by the search output format
+SEARCH_INDEX_FILE = 'search_index.json'
+MAX_SEARCH_LIMIT = 100
+
+
+class ConcertData:
+    """concerts.json held in memory, reloaded when the file changes on disk."""
+
+    def __init__(self, path: str = DATA_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._version = None
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the current snapshot, reloading it if the file changed.
+
+        Returns:
+            Dictionary with body, gzip_body, etag, index, search and scraped_venues,
+            or None if the
+            file does not exist
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        if version == self._version:
+            return self._snapshot
+
+        with self._lock:
+            # Another thread may have reloaded while we waited
+            if version != self._version:
+                self._snapshot = self._load()
+                self._version = version
+        return self._snapshot
+
+    def _load(self) -> Dict[str, Any]:
+        # The orchestrator replaces the file atomically, so a read never
+        # sees a partial write
+        with open(self.path, 'rb') as f:
+            body = f.read()
+        data = json.loads(body)
+        index = ConcertIndex(data.get('all_concerts', []))
+
+        # Reuse the index the orchestrator saved for this snapshot; rebuild
+        # it only if the file is missing or from another run
+        search_path = os.path.join(os.path.dirname(self.path), SEARCH_INDEX_FILE)
+        search = SearchIndex.load(search_path, index.concerts, data.get('last_updated'))
+        if search is None:
+            search = SearchIndex.from_concerts(index.concerts)
+        return {
+            'body': body,
+            'gzip_body': gzip.compress(body, compresslevel=6),
+            'etag': f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            'last_updated': data.get('last_updated'),
+            'index': index,
+            'search': search,
+            'scraped_venues': [
+                venue_id for venue_id, venue_data in data.get('venues', {}).items()
+                if venue_data.get('metadata', {}).get('status') == 'success'
+            ],
+        }
+
+
+# (status, headers, body) as produced by route()
+Response = Tuple[int, List[Tuple[str, str]], bytes]
+
+CORS_HEADERS = [
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'If-None-Match, Last-Event-ID'),
+    ('Access-Control-Expose-Headers', 'ETag'),
+]
+
+
+def body_response(status_code: int, content_type: str, body: bytes,
+                  etag: Optional[str] = None, encoding: Optional[str] = None) -> Response:
+    headers = [
+        ('Content-Type', f'{content_type}; charset=utf-8'),
+        ('Content-Length', str(len(body))),
+    ]
+    if etag:
+        headers += [('ETag', etag), ('Cache-Control', 'no-cache'), ('Vary', 'Accept-Encoding')]
+    if encoding:
+        headers.append(('Content-Encoding', encoding))
+    return status_code, headers + CORS_HEADERS, body
+
+
+def error_response(status_code: int, message: str) -> Response:
+    return body_response(status_code, 'application/json', json.dumps({"error": message}).encode('utf-8'))
+
+
+def not_modified(etag: str, request_headers) -> Optional[Response]:
+    """Build a 304 response if If-None-Match matches etag."""
+    if_none_match = request_headers.get('If-None-Match', '')
+    if etag not in [tag.strip() for tag in if_none_match.split(',')] and if_none_match.strip() != '*':
+        return None
+    return 304, [('ETag', etag), ('Cache-Control', 'no-cache'), ('Content-Length', '0')] + CORS_HEADERS, b''
+
+
+def gzip_etag(etag: str) -> str:
+    """ETag of the gzip representation of a body with the given ETag."""
+    return f'{etag[:-1]}-gzip"'
+
+
+def identity_etag(etag: str) -> str:
+    """Strip the gzip suffix from an ETag (the snapshot version it names)."""
+    if etag.endswith('-gzip"'):
+        return f'{etag[:-6]}"'
+    return etag
+
+
+def snapshot_response(snapshot: Dict[str, Any], request_headers) -> Response:
+    """Send cached JSON, honouring If-None-Match and Accept-Encoding."""
+    # The gzip and identity bodies are different representations, so each
+    # gets its own ETag and is revalidated against it
+    if 'gzip' in request_headers.get('Accept-Encoding', ''):
+        etag = gzip_etag(snapshot['etag'])
+        body, encoding = snapshot['gzip_body'], 'gzip'
+    else:
+        etag = snapshot['etag']
+        body, encoding = snapshot['body'], None
+
+    cached = not_modified(etag, request_headers)
+    if cached:
+        return cached
+    return body_response(200, 'application/json', body, etag=etag, encoding=encoding)
+
+
+def query_response(snapshot: Dict[str, Any], path: str, params: Dict[str, Any], request_headers) -> Response:
+    """Send one page of concerts matching the query parameters."""
+    # A page only changes with the snapshot, so derive its ETag from both
+    query_hash = hashlib.sha256(path.encode('utf-8')).hexdigest()[:12]
+    etag = f'{snapshot["etag"][:-1]}-{query_hash}"'
+    cached = not_modified(etag, request_headers)
+    if cached:
+        return cached
+
+    try:
+        page = snapshot['index'].query(**parse_query(params))
+    except QueryError as e:
+        return error_response(400, str(e))
+
+    body = json.dumps({
+        'last_updated': snapshot['last_updated'],
+        'count': len(page['concerts']),
+        **page
+    }, ensure_ascii=False).encode('utf-8')
+    return body_response(200, 'application/json', body, etag=etag)
+
+
+def search_response(snapshot: Dict[str, Any], path: str, params: Dict[str, Any], request_headers) -> Response:
+    """Send the concerts matching a search query (?q=, optional limit)."""
+    query_hash = hashlib.sha256(path.encode('utf-8')).hexdigest()[:12]
+    etag = f'{snapshot["etag"][:-1]}-{query_hash}"'
+    cached = not_modified(etag, request_headers)
+    if cached:
+        return cached
+
+    query = params.get('q', [''])[0]
+    try:
+        limit = max(1, min(int(params.get('limit', ['20'])[0]), MAX_SEARCH_LIMIT))
+    except ValueError:
+        return error_response(400, 'limit must be an integer')
+
+    concerts = snapshot['index'].concerts
+    results = [concerts[position] for position in snapshot['search'].search(query, limit)]
+    body = json.dumps({
+        'query': query,
+        'count': len(results),
+        'concerts': results
+    }, ensure_ascii=False).encode('utf-8')
+    return body_response(200, 'application/json', body, etag=etag)
+
+
+def route(concert_data: ConcertData, path: str, request_headers) -> Response:
+    """
+    Answer a GET request for the plain endpoints (/concerts, /search, /health).
+
+    Args:
+        concert_data: Shared snapshot holder
+        path: Request path including the query string
+        request_headers: Request headers (case-insensitive mapping)
+
+    Returns:
+        Tuple of (status code, headers, body)
+    """
+    parsed_path = urlparse(path)
+
+    if parsed_path.path == '/concerts':
+        snapshot = concert_data.get()
+        if snapshot is None:
+            return error_response(404, "Concert data not found")
+        params = parse_qs(parsed_path.query)
+        if any(name in params for name in QUERY_PARAMS):
+            return query_response(snapshot, path, params, request_headers)
+        return snapshot_response(snapshot, request_headers)
+    if parsed_path.path == '/search':
+        snapshot = concert_data.get()
+        if snapshot is None:
+            return error_response(404, "Concert data not found")
+        return search_response(snapshot, path, parse_qs(parsed_path.query), request_headers)
+    if parsed_path.path == '/health':
+        return body_response(200, 'text/plain', b'OK')
+    return body_response(404, 'text/plain', b'Not Found')
+
+
+class ConcertAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    concert_data = ConcertData()
 
-class ConcertAPIHandler(SimpleHTTPRequestHandler):
     def do_GET(self):
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path == '/concerts':
-            self.send_response(200, 'application/json', self.get_concerts_data())
-        elif parsed_path.path == '/health':
-            self.send_response(200, 'text/plain', 'OK')
-        else:
-            self.send_response(404, 'text/plain', 'Not Found')
-    
-    def send_response(self, status_code, content_type, content):
+        self.send(route(self.concert_data, self.path, self.headers))
+
+    def do_OPTIONS(self):
+        self.send((204, [('Content-Length', '0')] + CORS_HEADERS, b''))
+
+    def send(self, response: Response):
+        status_code, headers, body = response
         self.send_response(status_code)
-        self.send_header('Content-type', content_type)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        for name, value in headers:
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(content.encode('utf-8'))
-    
-    def get_concerts_data(self):
-        try:
-            with open('output/concerts.json', 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            return json.dumps({"error": "Concert data not found"})
-        except Exception as e:
-            return json.dumps({"error": str(e)})
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Per-request logging to stderr costs more than serving a cached body
+        pass
+
+
+def print_banner(port: int):
+    print(f"🚀 CopenMusic API Server running on http://localhost:{port}")
+    print(f"📊 Concerts endpoint: http://localhost:{port}/concerts")
+    print(f"🔎 Search: http://localhost:{port}/search?q=")
+    print(f"❤️  Health check: http://localhost:{port}/health")
+    print("Press Ctrl+C to stop the server")
+
+
+def serve_threaded(port: int):
+    server = ThreadingHTTPServer(('localhost', port), ConcertAPIHandler)
+    server.daemon_threads = True
+    print_banner(port)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def serve_async(port: int):
+    # Imported here so the threaded mode does not depend on it
+    from api_stream import serve
+
+    def on_ready(bound_port: int):
+        print_banner(bound_port)
+        print(f"📡 Live updates: http://localhost:{bound_port}/concerts/stream")
+
+    asyncio.run(serve('localhost', port, on_ready=on_ready))
+
 
 def main():
+    parser = argparse.ArgumentParser(description='CopenMusic API server')
+    parser.add_argument('--mode', choices=['threads', 'async'], default='threads',
+                        help='threads (default) or async, which adds /concerts/stream live updates')
+    args = parser.parse_args()
+    serve_mode = serve_async if args.mode == 'async' else serve_threaded
+
     port = 3001
-    
+
     # Try to find an available port
     while port <= 3010:
         try:
-            server = HTTPServer(('localhost', port), ConcertAPIHandler)
-            print(f"🚀 CopenMusic API Server running on http://localhost:{port}")
-            print(f"📊 Concerts endpoint: http://localhost:{port}/concerts")
-            print(f"❤️  Health check: http://localhost:{port}/health")
-            print("Press Ctrl+C to stop the server")
-            server.serve_forever()
-        except socket.error:
+            serve_mode(port)
+        except OSError:
             port += 1
-    
+            continue
+        except KeyboardInterrupt:
+            pass
+        return
+
     print("❌ No available ports found")
 
 if __name__ == '__main__':
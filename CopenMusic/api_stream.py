@@ -0,0 +1,285 @@
+"""
+Asyncio mode of the API server with live updates.
+Serves the same endpoints as api_server.py plus /concerts/stream, which
+pushes only the concerts that changed since a client's version, either as
+server-sent events or as a long poll. Idle clients wait on a shared event
+and cost no transfers until the data file changes.
+"""
+
+import asyncio
+import http.client
+import io
+import json
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from api_server import CORS_HEADERS, ConcertData, Response, body_response, identity_etag, route
+from change_feed import diff_concerts, index_concerts
+
+# Seconds between checks of the data file's modification time
+POLL_INTERVAL = 2.0
+# Seconds between SSE keep-alive comments on an idle stream
+KEEPALIVE_INTERVAL = 25.0
+# Longest long-poll wait a client may ask for, in seconds
+MAX_POLL_TIMEOUT = 60.0
+# Number of past updates kept for clients that reconnect
+HISTORY_SIZE = 20
+
+
+class ChangeHub:
+    """Tracks snapshot versions and the concert changes between them."""
+
+    def __init__(self, concert_data: ConcertData, history_size: int = HISTORY_SIZE):
+        """
+        Initialize the hub.
+
+        Args:
+            concert_data: Snapshot holder shared with the plain endpoints
+            history_size: Number of updates kept for catching up clients
+        """
+        self.concert_data = concert_data
+        self.etag: Optional[str] = None
+        self.last_updated: Optional[str] = None
+        self._concerts: Dict[str, Dict[str, Any]] = {}
+        self._history = deque(maxlen=history_size)
+        self._changed = asyncio.Event()
+
+    async def watch(self, interval: float = POLL_INTERVAL) -> None:
+        """Reload the snapshot whenever the data file changes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Reloading parses and compresses the file; keep that off the loop
+            snapshot = await loop.run_in_executor(None, self.concert_data.get)
+            self.apply(snapshot)
+            await asyncio.sleep(interval)
+
+    def apply(self, snapshot: Optional[Dict[str, Any]]) -> bool:
+        """
+        Record a new snapshot and wake waiting clients.
+
+        Args:
+            snapshot: Current snapshot from ConcertData.get()
+
+        Returns:
+            True if the snapshot is a new version
+        """
+        if snapshot is None or snapshot['etag'] == self.etag:
+            return False
+
+        concerts = index_concerts(snapshot['index'].concerts)
+        if self.etag is not None:
+            changes = diff_concerts(self._concerts, concerts, snapshot['scraped_venues'])
+            self._history.append({
+                'from': self.etag,
+                'etag': snapshot['etag'],
+                'last_updated': snapshot['last_updated'],
+                **changes
+            })
+
+        self.etag = snapshot['etag']
+        self.last_updated = snapshot['last_updated']
+        self._concerts = concerts
+
+        # Wake everyone waiting on the old version
+        self._changed.set()
+        self._changed = asyncio.Event()
+        return True
+
+    def changes_since(self, etag: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the updates that lead from a client's version to the current one.
+
+        Args:
+            etag: Version the client holds
+
+        Returns:
+            List of updates (empty if current), or None if the version is
+            unknown or too old and the client should reload /concerts
+        """
+        if etag == self.etag:
+            return []
+        updates = list(self._history)
+        for start, update in enumerate(updates):
+            if update['from'] == etag:
+                return updates[start:]
+        return None
+
+    async def wait(self, etag: Optional[str], timeout: float) -> bool:
+        """
+        Wait until the current version differs from etag.
+
+        Returns:
+            True if there is a newer version, False on timeout
+        """
+        if etag != self.etag:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+def _sse_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> bytes:
+    lines = [f'event: {event}']
+    if event_id:
+        lines.append(f'id: {event_id}')
+    lines.append(f'data: {json.dumps(data, ensure_ascii=False)}')
+    return ('\n'.join(lines) + '\n\n').encode('utf-8')
+
+
+async def stream_events(writer: asyncio.StreamWriter, hub: ChangeHub, etag: Optional[str]) -> None:
+    """
+    Serve /concerts/stream as server-sent events until the client leaves.
+
+    A new client first gets a "version" event and is expected to load
+    /concerts; after that it receives a "changes" event per update. A
+    reconnecting client (Last-Event-ID) is caught up from the history, or
+    told to "reload" if its version is too old.
+
+    Args:
+        writer: Client connection
+        hub: Change hub
+        etag: Version the client already holds, if any
+    """
+    headers = [
+        ('Content-Type', 'text/event-stream; charset=utf-8'),
+        ('Cache-Control', 'no-cache'),
+        ('Connection', 'close'),
+    ] + CORS_HEADERS
+    writer.write(_response_head(200, headers))
+    writer.write(b'retry: 5000\n\n')
+
+    if etag is None:
+        writer.write(_sse_event('version', {'etag': hub.etag, 'last_updated': hub.last_updated}, hub.etag))
+        etag = hub.etag
+
+    while True:
+        updates = hub.changes_since(etag)
+        if updates is None:
+            writer.write(_sse_event('reload', {'etag': hub.etag, 'last_updated': hub.last_updated}, hub.etag))
+        for update in updates or []:
+            writer.write(_sse_event('changes', update, update['etag']))
+        etag = hub.etag
+        await writer.drain()
+
+        if not await hub.wait(etag, KEEPALIVE_INTERVAL):
+            writer.write(b': keepalive\n\n')
+            await writer.drain()
+
+
+async def long_poll(hub: ChangeHub, params: Dict[str, List[str]]) -> Response:
+    """
+    Serve /concerts/stream?since=<etag>&timeout=<seconds> as a long poll.
+
+    Returns at once if the client is behind, otherwise when the next update
+    arrives or the timeout expires (with an empty changes list).
+    """
+    since = params.get('since', [None])[0]
+    if since is not None:
+        since = identity_etag(since)
+    try:
+        timeout = min(float(params.get('timeout', ['25'])[0]), MAX_POLL_TIMEOUT)
+    except ValueError:
+        timeout = 25.0
+
+    payload = {'etag': hub.etag, 'last_updated': hub.last_updated, 'changes': []}
+    if since is not None:
+        await hub.wait(since, timeout)
+        updates = hub.changes_since(since)
+        payload = {'etag': hub.etag, 'last_updated': hub.last_updated}
+        if updates is None:
+            payload['reload'] = True
+        else:
+            payload['changes'] = updates
+
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    return body_response(200, 'application/json', body)
+
+
+def _response_head(status_code: int, headers: List[Any]) -> bytes:
+    reason = http.client.responses.get(status_code, '')
+    lines = [f'HTTP/1.1 {status_code} {reason}'] + [f'{name}: {value}' for name, value in headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            hub: ChangeHub, concert_data: ConcertData) -> None:
+    """Serve HTTP/1.1 requests on one client connection."""
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                break
+
+            request_line, _, header_bytes = head.partition(b'\r\n')
+            try:
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+            except ValueError:
+                break
+            headers = http.client.parse_headers(io.BytesIO(header_bytes))
+            parsed_path = urlparse(path)
+
+            if method == 'OPTIONS':
+                response = (204, [('Content-Length', '0')] + CORS_HEADERS, b'')
+            elif method != 'GET':
+                response = body_response(405, 'text/plain', b'Method Not Allowed')
+            elif parsed_path.path == '/concerts/stream':
+                params = parse_qs(parsed_path.query)
+                if 'text/event-stream' in headers.get('Accept', ''):
+                    since = headers.get('Last-Event-ID') or params.get('since', [None])[0]
+                    await stream_events(writer, hub, identity_etag(since) if since else None)
+                    break
+                response = await long_poll(hub, params)
+            else:
+                # A changed data file is reloaded inside route(); run it in a
+                # thread so open streams and long polls are not stalled
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, route, concert_data, path, headers
+                )
+
+            status_code, response_headers, body = response
+            writer.write(_response_head(status_code, response_headers) + body)
+            await writer.drain()
+
+            if headers.get('Connection', '').lower() == 'close':
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str, port: int, on_ready: Callable[[int], None] = None,
+                concert_data: Optional[ConcertData] = None) -> None:
+    """
+    Run the asyncio API server until cancelled.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        on_ready: Called with the port once the socket is bound
+        concert_data: Snapshot holder (defaults to output/concerts.json)
+
+    Raises:
+        OSError: If the port cannot be bound
+    """
+    concert_data = concert_data or ConcertData()
+    hub = ChangeHub(concert_data)
+    hub.apply(await asyncio.get_running_loop().run_in_executor(None, concert_data.get))
+
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(reader, writer, hub, concert_data),
+        host, port
+    )
+    if on_ready:
+        on_ready(port)
+
+    watcher = asyncio.create_task(hub.watch())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
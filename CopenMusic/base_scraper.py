@@ -3,19 +3,140 @@ Base scraper class for concert venues.
 Provides common functionality for all venue-specific scrapers.
 """
 
+import asyncio
 import requests
+import sys
 import time
 import logging
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-import re
+from bs4 import BeautifulSoup, SoupStrainer
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+import hashlib
+import importlib.util
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from operator import attrgetter
+from urllib.parse import urljoin, urlparse
+
+import patterns
+from concert import Concert
+from enrichment import STATUS_SELECTOR, extract_event_details, merge_details
+from http_cache import HttpCache
+from parse_cache import CACHE_VERSION, ParseCache
+from rate_limiter import TokenBucket, get_host_bucket
+
+try:
+    import aiohttp
+except ImportError:
+    # Async fetch mode is optional; the orchestrator falls back to threads
+    aiohttp = None
+
+# BeautifulSoup tree builders in order of preference, and the module each needs
+PARSER_BACKENDS = {
+    'lxml': 'lxml',
+    'html.parser': None,
+    'html5lib': 'html5lib',
+}
+
+
+def parser_available(parser: str) -> bool:
+    """Check whether a BeautifulSoup parser backend can be used."""
+    if parser not in PARSER_BACKENDS:
+        return False
+    module = PARSER_BACKENDS[parser]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def default_parser() -> str:
+    """Get the fastest installed parser backend (lxml, else html.parser)."""
+    return 'lxml' if parser_available('lxml') else 'html.parser'
+
+
+# Shared helper modules whose code shapes normalized concerts
+NORMALIZATION_MODULES = ('concert', 'patterns', 'danish_dates', 'enrichment')
+
+
+@lru_cache(maxsize=None)
+def scraper_code_hash(scraper_class: type) -> str:
+    """
+    Hash the source files of a scraper class and its scraper base classes.
+    
+    Part of the parse cache fingerprint, so cached results are not reused
+    after the parsing or normalization code changes.
+    """
+    module_names = [cls.__module__ for cls in scraper_class.__mro__ if issubclass(cls, BaseScraper)]
+    digest = hashlib.sha256()
+    for module_name in module_names + list(NORMALIZATION_MODULES):
+        path = getattr(sys.modules.get(module_name), '__file__', None)
+        if path:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+# Scraper instances reused by parse_in_worker within each worker process
+_worker_scrapers: Dict[Tuple[type, str], 'BaseScraper'] = {}
+
+
+def parse_in_worker(scraper_class: type, config: Dict[str, Any], url: str,
+                    content: bytes) -> Tuple[List[Concert], List[str]]:
+    """
+    Parse a page body in a worker process of the parse process pool.
+    
+    Args:
+        scraper_class: Scraper class that owns the page
+        config: Scraper configuration
+        url: URL the page was fetched from
+        content: Raw page body
+        
+    Returns:
+        Tuple of (normalized concerts, next-page URLs)
+    """
+    return _worker_scraper(scraper_class, config).parse_content(url, content)
+
+
+def parse_event_in_worker(scraper_class: type, config: Dict[str, Any], content: bytes) -> Dict[str, Any]:
+    """
+    Extract details from an event page in a worker process of the parse pool.
+    
+    Args:
+        scraper_class: Scraper class that owns the page
+        config: Scraper configuration
+        content: Raw event page body
+        
+    Returns:
+        Output of the scraper's parse_event_page()
+    """
+    scraper = _worker_scraper(scraper_class, config)
+    return scraper.parse_event_page(BeautifulSoup(content, scraper.parser))
+
+
+def _worker_scraper(scraper_class: type, config: Dict[str, Any]) -> 'BaseScraper':
+    key = (scraper_class, config.get('venue_id', 'unknown'))
+    scraper = _worker_scrapers.get(key)
+    if scraper is None:
+        # Caches are read and written by the parent process only
+        scraper = scraper_class({**config, 'cache': {}})
+        _worker_scrapers[key] = scraper
+    return scraper
 
 
 class BaseScraper(ABC):
     """Base class for all venue scrapers with common functionality."""
     
+    # Subtrees parse_concerts() needs. Subclasses set this to a SoupStrainer
+    # so only those parts of the page are built into the DOM.
+    parse_only: Optional[SoupStrainer] = None
+    
+    # Placeholder time used when the listing shows none. Detail-page
+    # enrichment replaces it with the real time when it finds one.
+    default_time: Optional[str] = None
+    
+    # Status word used when the listing shows no ticket status. A status
+    # read from the event page's ticket element replaces it.
+    default_status: Optional[str] = None
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize scraper with venue configuration.
@@ -27,10 +148,20 @@ class BaseScraper(ABC):
         self.venue_id = config.get('venue_id', 'unknown')
         self.venue_name = config.get('venue_name', 'Unknown Venue')
         self.base_url = config.get('url', '')
-        rate_limit_config = config.get('rate_limit', {})
-        self.rate_limit = rate_limit_config.get('requests_per_minute', 1) / 60  # Convert to requests per second
+        self.rate_limit_config = config.get('rate_limit', {})
         self.session = requests.Session()
+        cache_config = config.get('cache', {})
+        self.http_cache = HttpCache.from_config(cache_config.get('http', {}))
+        self.parse_cache = ParseCache.from_config(cache_config.get('parse', {}))
         self.logger = self._setup_logger()
+        self.parser = self._select_parser(config.get('parser'))
+        self.pagination = config.get('pagination', {})
+        self.max_pages = self.pagination.get('max_pages', 12)
+        self.page_workers = self.pagination.get('max_workers', 4)
+        self.enrichment = config.get('enrichment', {})
+        self.keep_raw_data = config.get('keep_raw_data', False)
+        # Optional process pool for the CPU-bound parse stage, set by the orchestrator
+        self.parse_executor: Optional[Executor] = None
         
         # Set up session headers
         self.session.headers.update({
@@ -56,27 +187,75 @@ class BaseScraper(ABC):
         
         return logger
     
-    def fetch_page(self, url: str = None, retries: int = 3) -> Optional[BeautifulSoup]:
+    def _select_parser(self, parser: Optional[str]) -> str:
+        """Resolve the configured parser backend, falling back if unavailable."""
+        if not parser:
+            return default_parser()
+        if not parser_available(parser):
+            fallback = default_parser()
+            self.logger.warning(f"Parser backend '{parser}' is not available, using '{fallback}'")
+            return fallback
+        return parser
+    
+    def parse_html(self, content: bytes, full_tree: bool = False) -> BeautifulSoup:
         """
-        Fetch and parse a web page with retries.
+        Build a BeautifulSoup tree with the configured parser backend.
+        
+        Only the subtrees declared in parse_only are built. html5lib always
+        builds the full tree, so the strainer is skipped for that backend.
+        
+        Args:
+            content: Raw page body
+            full_tree: Build the whole tree even if parse_only is set
+            
+        Returns:
+            Parsed BeautifulSoup object
+        """
+        if self.parse_only is not None and self.parser != 'html5lib' and not full_tree:
+            return BeautifulSoup(content, self.parser, parse_only=self.parse_only)
+        return BeautifulSoup(content, self.parser)
+    
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """Get the token bucket shared by all requests to the host of url."""
+        return get_host_bucket(url, self.rate_limit_config)
+    
+    def fetch_content(self, url: str = None, retries: int = 3) -> Tuple[Optional[bytes], str]:
+        """
+        Fetch the raw body of a web page with retries and conditional GET.
         
         Args:
             url: URL to fetch (optional, uses base_url if not provided)
             retries: Number of retry attempts
             
         Returns:
-            BeautifulSoup object or None if failed
+            Tuple of (response body or None if failed, HTTP cache status).
+            The cache status is 'revalidated' when the server answered 304
+            and the cached body was reused, otherwise 'miss'.
         """
         if url is None:
             url = self.base_url
+        
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        headers = HttpCache.conditional_headers(cached)
             
         for attempt in range(retries):
             try:
-                response = self.session.get(url, timeout=self.config.get('timeout', 30))
+                time.sleep(self._rate_limiter(url).reserve())
+                response = self.session.get(url, headers=headers,
+                                            timeout=self.config.get('timeout', 30))
+                
+                if response.status_code == 304 and cached:
+                    body = self._reuse_cached_body(url, cached)
+                    if body is not None:
+                        return body, 'revalidated'
+                    headers = {}
+                    continue
+                
                 response.raise_for_status()
-                time.sleep(1 / self.rate_limit)
+                if self.http_cache:
+                    self.http_cache.store(url, response.content, response.headers)
                 
-                return BeautifulSoup(response.content, 'html.parser')
+                return response.content, 'miss'
                 
             except requests.RequestException as e:
                 self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
@@ -84,7 +263,99 @@ class BaseScraper(ABC):
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     self.logger.error(f"Failed to fetch page after {retries} attempts")
-                    return None
+        
+        return None, 'miss'
+    
+    async def fetch_content_async(self, session: 'aiohttp.ClientSession', url: str = None,
+                                  retries: int = 3) -> Tuple[Optional[bytes], str]:
+        """
+        Async variant of fetch_content() that does not block a thread.
+        
+        Args:
+            session: Pooled aiohttp session shared by all scrapers
+            url: URL to fetch (optional, uses base_url if not provided)
+            retries: Number of retry attempts
+            
+        Returns:
+            Tuple of (response body or None if failed, HTTP cache status)
+        """
+        if url is None:
+            url = self.base_url
+        
+        timeout = aiohttp.ClientTimeout(total=self.config.get('timeout', 30))
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        conditional_headers = HttpCache.conditional_headers(cached)
+            
+        for attempt in range(retries):
+            try:
+                await asyncio.sleep(self._rate_limiter(url).reserve())
+                headers = {**self.session.headers, **conditional_headers}
+                async with session.get(url, headers=headers, timeout=timeout) as response:
+                    if response.status == 304 and cached:
+                        body = self._reuse_cached_body(url, cached)
+                        if body is not None:
+                            return body, 'revalidated'
+                        conditional_headers = {}
+                        continue
+                    
+                    response.raise_for_status()
+                    content = await response.read()
+                
+                if self.http_cache:
+                    self.http_cache.store(url, content, response.headers)
+                
+                return content, 'miss'
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+                if attempt < retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    self.logger.error(f"Failed to fetch page after {retries} attempts")
+        
+        return None, 'miss'
+    
+    def _reuse_cached_body(self, url: str, cached: Dict[str, Any]) -> Optional[bytes]:
+        """Return the cached body after a 304 and mark the entry as revalidated."""
+        body = self.http_cache.read_body(url)
+        if body is not None:
+            self.http_cache.refresh(url, cached)
+            self.logger.info(f"Page not modified, reusing cached copy of {url}")
+        return body
+    
+    def fetch_page(self, url: str = None, retries: int = 3) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a web page with retries.
+        
+        Args:
+            url: URL to fetch (optional, uses base_url if not provided)
+            retries: Number of retry attempts
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        content, _ = self.fetch_content(url, retries)
+        if content is None:
+            return None
+        return self.parse_html(content)
+    
+    async def fetch_page_async(self, session: 'aiohttp.ClientSession', url: str = None,
+                               retries: int = 3) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a web page with retries without blocking a thread.
+        
+        Args:
+            session: Pooled aiohttp session shared by all scrapers
+            url: URL to fetch (optional, uses base_url if not provided)
+            retries: Number of retry attempts
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        content, _ = await self.fetch_content_async(session, url, retries)
+        if content is None:
+            return None
+        return self.parse_html(content)
     
     @abstractmethod
     def parse_concerts(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
@@ -100,7 +371,7 @@ class BaseScraper(ABC):
         """
         pass
     
-    def normalize_data(self, raw_concert: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_data(self, raw_concert: Dict[str, Any]) -> Concert:
         """
         Convert venue-specific concert data to unified structure.
         
@@ -108,7 +379,7 @@ class BaseScraper(ABC):
             raw_concert: Raw concert data from venue scraper
             
         Returns:
-            Normalized concert data dictionary
+            Normalized concert
         """
         # Generate unique ID
         concert_id = self._generate_concert_id(raw_concert)
@@ -121,20 +392,21 @@ class BaseScraper(ABC):
         # Normalize status
         status = self._normalize_status(raw_concert.get('status', ''))
         
-        return {
-            'id': concert_id,
-            'name': raw_concert.get('name', '').strip(),
-            'date': normalized_date,
-            'time': normalized_time,
-            'status': status,
-            'url': raw_concert.get('url', ''),
-            'support': raw_concert.get('support', ''),
-            'genre': raw_concert.get('genre', ''),
-            'price': raw_concert.get('price', None),
-            'venue': self.venue_id,
-            'venue_name': self.venue_name,
-            'raw_data': raw_concert  # Keep original data for debugging
-        }
+        return Concert(
+            id=concert_id,
+            name=raw_concert.get('name', '').strip(),
+            date=normalized_date,
+            time=normalized_time,
+            status=status,
+            url=raw_concert.get('url', ''),
+            support=raw_concert.get('support', ''),
+            genre=raw_concert.get('genre', ''),
+            price=raw_concert.get('price', None),
+            venue=self.venue_id,
+            venue_name=self.venue_name,
+            # Debug mode: the orchestrator moves this to a sidecar file
+            raw_data=raw_concert if self.keep_raw_data else None
+        )
     
     def _generate_concert_id(self, raw_concert: Dict[str, Any]) -> str:
         """Generate unique concert ID."""
@@ -144,29 +416,21 @@ class BaseScraper(ABC):
     
     def _normalize_datetime(self, date_str: str, time_str: str) -> tuple[str, str]:
         """Normalize date and time to consistent format."""
-        # Handle Danish date formats (DD.MM.YYYY, DD/MM/YYYY, etc.)
-        date_patterns = [
-            r'(\d{2})\.(\d{2})\.(\d{4})',  # DD.MM.YYYY
-            r'(\d{2})/(\d{2})/(\d{4})',   # DD/MM/YYYY
-            r'(\d{4})-(\d{2})-(\d{2})',   # YYYY-MM-DD
-        ]
-        
+        # Handle Danish (DD.MM.YYYY, DD/MM/YYYY) and ISO dates in one pass
         normalized_date = date_str
-        for pattern in date_patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                if pattern.startswith(r'(\d{2})'):  # Danish format
-                    day, month, year = match.groups()
-                else:  # ISO format
-                    year, month, day = match.groups()
-                normalized_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                break
+        match = patterns.DATE.search(date_str)
+        if match:
+            if match.group('year'):  # Danish format
+                day, month, year = match.group('day', 'month', 'year')
+            else:  # ISO format
+                day, month, year = match.group('iso_day', 'iso_month', 'iso_year')
+            normalized_date = f"{year}-{month}-{day}"
         
         # Normalize time (ensure HH:MM format)
         normalized_time = time_str
         if time_str and ':' not in time_str:
             # Handle formats like "20:00" -> "20:00", "20" -> "20:00"
-            if re.match(r'^\d{1,2}$', time_str):
+            if patterns.HOUR_ONLY.match(time_str):
                 normalized_time = f"{time_str.zfill(2)}:00"
         
         return normalized_date, normalized_time
@@ -188,23 +452,26 @@ class BaseScraper(ABC):
         
         return status_mapping.get(status_lower, 'available')
     
-    def validate_concert(self, concert: Dict[str, Any]) -> bool:
+    def validate_concert(self, concert: Concert) -> bool:
         """
         Validate concert data has required fields.
         
         Args:
-            concert: Concert data dictionary
+            concert: Normalized concert
             
         Returns:
             True if valid, False otherwise
         """
         required_fields = ['name', 'date', 'url']
-        return all(concert.get(field) for field in required_fields)
+        return all(getattr(concert, field) for field in required_fields)
     
     def run(self) -> Dict[str, Any]:
         """
         Main execution method for the scraper.
         
+        Fetches every seed URL plus any discovered "next" pages, with each
+        wave of pages fetched concurrently within the host's rate limit.
+        
         Returns:
             Dictionary with venue results and metadata
         """
@@ -212,56 +479,506 @@ class BaseScraper(ABC):
         self.logger.info(f"Starting scraper for {self.venue_name}")
         
         try:
-            # Fetch the main page
-            soup = self.fetch_page()
-            if not soup:
-                return self._create_error_result("Failed to fetch page")
+            crawl = self._new_crawl()
+            pending = list(crawl['seeds'])
+            with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+                while pending:
+                    pages = list(executor.map(self._fetch_and_process, pending))
+                    pending = self._process_wave(crawl, pages)
             
-            # Parse concerts
-            raw_concerts = self.parse_concerts(soup)
-            self.logger.info(f"Found {len(raw_concerts)} raw concert entries")
+            if self.enrichment.get('enabled', False):
+                enrich_start = time.perf_counter()
+                crawl['enrichment'] = self.enrich_concerts(list(crawl['concerts'].values()))
+                crawl['timings']['enrich_seconds'] = time.perf_counter() - enrich_start
             
-            # Normalize and validate concerts
-            normalized_concerts = []
-            for raw_concert in raw_concerts:
-                try:
-                    normalized = self.normalize_data(raw_concert)
-                    if self.validate_concert(normalized):
-                        normalized_concerts.append(normalized)
-                    else:
-                        self.logger.warning(f"Invalid concert data: {raw_concert.get('name', 'Unknown')}")
-                except Exception as e:
-                    self.logger.error(f"Error normalizing concert: {e}")
+            return self._build_result(crawl, start_time)
             
-            # Sort concerts by date and time
-            try:
-                normalized_concerts.sort(key=lambda x: (x.get('date', ''), x.get('time', '')))
-            except TypeError:
-                # Fallback for Python < 3.11
-                normalized_concerts.sort(key=lambda x: (x.get('date', ''), x.get('time', '')))
+        except Exception as e:
+            self.logger.error(f"Scraper failed: {e}")
+            return self._create_error_result(str(e))
+    
+    async def run_async(self, session: 'aiohttp.ClientSession') -> Dict[str, Any]:
+        """
+        Async variant of run() using a shared HTTP client session.
+        
+        Args:
+            session: Pooled aiohttp session shared by all scrapers
             
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+        Returns:
+            Dictionary with venue results and metadata
+        """
+        start_time = datetime.now()
+        self.logger.info(f"Starting async scraper for {self.venue_name}")
+        
+        try:
+            crawl = self._new_crawl()
+            pending = list(crawl['seeds'])
+            while pending:
+                pages = await asyncio.gather(
+                    *(self._fetch_and_process_async(session, url) for url in pending)
+                )
+                pending = self._process_wave(crawl, pages)
             
-            log_msg = f"Successfully processed {len(normalized_concerts)} concerts in {duration:.2f}s"
-            self.logger.info(log_msg)
+            if self.enrichment.get('enabled', False):
+                enrich_start = time.perf_counter()
+                crawl['enrichment'] = await self.enrich_concerts_async(
+                    session, list(crawl['concerts'].values())
+                )
+                crawl['timings']['enrich_seconds'] = time.perf_counter() - enrich_start
             
-            return {
-                'venue_id': self.venue_id,
-                'venue_name': self.venue_name,
-                'concerts': normalized_concerts,
-                'metadata': {
-                    'total_concerts': len(normalized_concerts),
-                    'scraped_at': start_time.isoformat(),
-                    'duration_seconds': duration,
-                    'status': 'success'
-                }
-            }
+            return self._build_result(crawl, start_time)
             
         except Exception as e:
             self.logger.error(f"Scraper failed: {e}")
             return self._create_error_result(str(e))
     
+    @property
+    def seed_urls(self) -> List[str]:
+        """URLs every run starts from: base_url plus pagination.urls."""
+        urls = [self.base_url] + list(self.pagination.get('urls', []))
+        return list(dict.fromkeys(url for url in urls if url))
+    
+    def _new_crawl(self) -> Dict[str, Any]:
+        """Create the bookkeeping state for one multi-page run."""
+        seeds = self.seed_urls[:self.max_pages]
+        return {
+            'seeds': seeds,
+            'queued': set(seeds),
+            'concerts': {},
+            'pages': 0,
+            'failed_pages': 0,
+            'http_cache': {},
+            'parse_cache': {},
+            'timings': {'fetch_seconds': 0.0, 'parse_seconds': 0.0},
+        }
+    
+    def _fetch_and_process(self, url: str) -> Dict[str, Any]:
+        """
+        Fetch one page and turn it into concerts, timing both stages.
+        
+        Args:
+            url: Page to fetch
+            
+        Returns:
+            Page dictionary for _process_wave()
+        """
+        fetch_start = time.perf_counter()
+        content, cache_status = self.fetch_content(url)
+        page = {
+            'url': url,
+            'http_cache': cache_status,
+            'fetch_seconds': time.perf_counter() - fetch_start,
+        }
+        if content is not None:
+            parse_start = time.perf_counter()
+            page.update(self._process_content(url, content))
+            page['parse_seconds'] = time.perf_counter() - parse_start
+        return page
+    
+    async def _fetch_and_process_async(self, session: 'aiohttp.ClientSession', url: str) -> Dict[str, Any]:
+        """
+        Async variant of _fetch_and_process().
+        
+        With a parse process pool, processing is handed off so the event
+        loop keeps serving other venues' I/O while the page is parsed.
+        
+        Args:
+            session: Pooled aiohttp session shared by all scrapers
+            url: Page to fetch
+            
+        Returns:
+            Page dictionary for _process_wave()
+        """
+        fetch_start = time.perf_counter()
+        content, cache_status = await self.fetch_content_async(session, url)
+        page = {
+            'url': url,
+            'http_cache': cache_status,
+            'fetch_seconds': time.perf_counter() - fetch_start,
+        }
+        if content is not None:
+            parse_start = time.perf_counter()
+            if self.parse_executor is not None:
+                loop = asyncio.get_running_loop()
+                page.update(await loop.run_in_executor(None, self._process_content, url, content))
+            else:
+                page.update(self._process_content(url, content))
+            page['parse_seconds'] = time.perf_counter() - parse_start
+        return page
+    
+    def _process_wave(self, crawl: Dict[str, Any], pages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Merge one wave of processed pages and queue newly discovered pages.
+        
+        Args:
+            crawl: Bookkeeping state from _new_crawl()
+            pages: Page dictionaries from _fetch_and_process()
+            
+        Returns:
+            URLs to fetch in the next wave
+        """
+        next_wave = []
+        for page in pages:
+            crawl['timings']['fetch_seconds'] += page['fetch_seconds']
+            if 'concerts' not in page:
+                crawl['failed_pages'] += 1
+                self.logger.warning(f"Skipping page that could not be fetched: {page['url']}")
+                continue
+            
+            crawl['pages'] += 1
+            crawl['timings']['parse_seconds'] += page['parse_seconds']
+            for counter in ('http_cache', 'parse_cache'):
+                status = page[counter]
+                crawl[counter][status] = crawl[counter].get(status, 0) + 1
+            
+            # Merge, keeping the first copy of concerts listed on several pages
+            for concert in page['concerts']:
+                crawl['concerts'].setdefault(concert.id, concert)
+            
+            for next_url in page['next_pages']:
+                if next_url not in crawl['queued'] and len(crawl['queued']) < self.max_pages:
+                    crawl['queued'].add(next_url)
+                    next_wave.append(next_url)
+        
+        return next_wave
+    
+    def _process_content(self, url: str, content: bytes) -> Dict[str, Any]:
+        """
+        Turn one fetched page body into normalized concerts and next-page URLs.
+        
+        When the body is byte-identical to the one seen for this page on the
+        previous run (including bodies reused after a 304), the results
+        from last time are returned without parsing again.
+        
+        Args:
+            url: URL the page was fetched from
+            content: Raw page body
+            
+        Returns:
+            Dictionary with normalized concerts, next_pages and parse_cache status
+        """
+        page_key = self._page_key(url)
+        content_hash = None
+        parse_status = 'disabled'
+        if self.parse_cache:
+            content_hash = ParseCache.content_hash(content)
+            fingerprint = self.cache_fingerprint()
+            cached = self.parse_cache.get(page_key, content_hash, fingerprint)
+            if cached is not None:
+                self.logger.info(f"Page unchanged, reusing {len(cached['concerts'])} previously parsed concerts")
+                return {
+                    'concerts': [Concert.from_dict(concert) for concert in cached['concerts']],
+                    'next_pages': cached.get('next_pages', []),
+                    'parse_cache': 'hit',
+                }
+            parse_status = 'miss'
+        
+        if self.parse_executor is not None:
+            # Parse in a worker process so CPU work is not serialized by the GIL
+            future = self.parse_executor.submit(parse_in_worker, type(self), self.config, url, content)
+            concerts, next_pages = future.result()
+        else:
+            concerts, next_pages = self.parse_content(url, content)
+        
+        if self.parse_cache:
+            self.parse_cache.put(page_key, content_hash, fingerprint,
+                                 [concert.to_dict() for concert in concerts], next_pages)
+        
+        return {'concerts': concerts, 'next_pages': next_pages, 'parse_cache': parse_status}
+    
+    def cache_fingerprint(self) -> str:
+        """
+        Identify everything besides the page body that parse results depend on.
+        
+        Covers the parse cache format, the scraper class and its code, the
+        parser backend, whether raw payloads are kept, and today's date
+        (dates without a year are resolved against it).
+        
+        Returns:
+            Fingerprint string stored with parse cache entries
+        """
+        scraper_class = type(self)
+        return '|'.join([
+            str(CACHE_VERSION),
+            f"{scraper_class.__module__}.{scraper_class.__qualname__}",
+            scraper_code_hash(scraper_class),
+            self.parser,
+            'raw' if self.keep_raw_data else 'no-raw',
+            date.today().isoformat(),
+        ])
+    
+    def parse_content(self, url: str, content: bytes) -> Tuple[List[Concert], List[str]]:
+        """
+        Parse a page body into normalized concerts and next-page URLs.
+        
+        Args:
+            url: URL the page was fetched from
+            content: Raw page body
+            
+        Returns:
+            Tuple of (normalized concerts, next-page URLs)
+        """
+        # Next-page links may sit outside the parse_only subtrees, so the full
+        # tree is built when pagination follows them; the page is parsed once
+        soup = self.parse_html(content, full_tree=self._follows_next_pages())
+        return self.process_page(soup), self.find_next_pages(soup, url)
+    
+    def _page_key(self, url: str) -> str:
+        """Stable cache key for one page of this venue."""
+        if url == self.base_url:
+            return self.venue_id
+        return f"{self.venue_id}-{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}"
+    
+    def _follows_next_pages(self) -> bool:
+        """Whether pages are searched for links to further pages."""
+        return bool(self.pagination.get('next_selector')) and self.max_pages > 1
+    
+    def find_next_pages(self, soup: BeautifulSoup, url: str) -> List[str]:
+        """
+        Discover further calendar pages linked from a page.
+        
+        Uses the pagination.next_selector CSS selector, matched against
+        the page's links (so it should select a or link elements).
+        Scrapers can override this for venue-specific pagination.
+        
+        Args:
+            soup: Page tree already built for parsing the concerts
+            url: URL the page was fetched from
+            
+        Returns:
+            Absolute URLs of pages to fetch next
+        """
+        if not self._follows_next_pages():
+            return []
+        
+        next_pages = []
+        for element in soup.select(self.pagination['next_selector']):
+            href = element.get('href')
+            if href:
+                next_pages.append(urljoin(url, href))
+        return list(dict.fromkeys(next_pages))
+    
+    def _detail_urls_by_host(self, concerts: List[Concert]) -> Dict[str, List[str]]:
+        """Group the distinct event-page URLs of concerts by host."""
+        listing_urls = set(self.seed_urls)
+        urls_by_host = {}
+        for concert in concerts:
+            url = concert.url
+            if url and url not in listing_urls:
+                urls = urls_by_host.setdefault(urlparse(url).netloc, [])
+                if url not in urls:
+                    urls.append(url)
+        return urls_by_host
+    
+    def enrich_concerts(self, concerts: List[Concert]) -> Dict[str, int]:
+        """
+        Fill time, price, genre and status of concerts from their event pages.
+        
+        Each host gets its own worker pool of enrichment.max_workers_per_host
+        threads, and every request still goes through the host's rate limit.
+        
+        Args:
+            concerts: Normalized concerts, updated in place
+            
+        Returns:
+            Counts of detail pages by outcome (fresh, unchanged, parsed, failed)
+        """
+        urls_by_host = self._detail_urls_by_host(concerts)
+        workers = self.enrichment.get('max_workers_per_host', 4)
+        executors = {host: ThreadPoolExecutor(max_workers=workers) for host in urls_by_host}
+        
+        try:
+            futures = {
+                executors[host].submit(self._fetch_details, url): url
+                for host, urls in urls_by_host.items()
+                for url in urls
+            }
+            outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
+        
+        return self._apply_details(concerts, outcomes)
+    
+    async def enrich_concerts_async(self, session: 'aiohttp.ClientSession',
+                                    concerts: List[Concert]) -> Dict[str, int]:
+        """
+        Async variant of enrich_concerts() bounded by a semaphore per host.
+        
+        Args:
+            session: Pooled aiohttp session shared by all scrapers
+            concerts: Normalized concerts, updated in place
+            
+        Returns:
+            Counts of detail pages by outcome (fresh, unchanged, parsed, failed)
+        """
+        urls_by_host = self._detail_urls_by_host(concerts)
+        workers = self.enrichment.get('max_workers_per_host', 4)
+        semaphores = {host: asyncio.Semaphore(workers) for host in urls_by_host}
+        
+        async def fetch_bounded(host: str, url: str) -> Tuple[Optional[Dict[str, Any]], str]:
+            async with semaphores[host]:
+                return await self._fetch_details_async(session, url)
+        
+        urls = [(host, url) for host, host_urls in urls_by_host.items() for url in host_urls]
+        results = await asyncio.gather(*(fetch_bounded(host, url) for host, url in urls))
+        outcomes = {url: result for (_, url), result in zip(urls, results)}
+        
+        return self._apply_details(concerts, outcomes)
+    
+    def _apply_details(self, concerts: List[Concert],
+                       outcomes: Dict[str, Tuple[Optional[Dict[str, Any]], str]]) -> Dict[str, int]:
+        """Merge fetched event-page details into concerts and count outcomes."""
+        stats = {}
+        for details, status in outcomes.values():
+            stats[status] = stats.get(status, 0) + 1
+        
+        for concert in concerts:
+            details, _ = outcomes.get(concert.url, (None, None))
+            if details:
+                merge_details(concert, details, self.default_time, self.default_status,
+                              self._normalize_status)
+        
+        self.logger.info(f"Enriched concerts from {len(outcomes)} event pages: {stats}")
+        return stats
+    
+    def _recent_details(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get event-page details checked within enrichment.max_age_seconds."""
+        max_age = self.enrichment.get('max_age_seconds', 0)
+        if not self.parse_cache or not max_age:
+            return None
+        entry = self.parse_cache.get_recent(self._page_key(url), max_age, self.cache_fingerprint())
+        return entry['concerts'][0] if entry and entry['concerts'] else None
+    
+    def _fetch_details(self, url: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Fetch and extract one event page, reusing cached results when possible."""
+        details = self._recent_details(url)
+        if details is not None:
+            return details, 'fresh'
+        content, _ = self.fetch_content(url)
+        if content is None:
+            return None, 'failed'
+        return self._details_from_content(url, content)
+    
+    async def _fetch_details_async(self, session: 'aiohttp.ClientSession',
+                                   url: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Async variant of _fetch_details()."""
+        details = self._recent_details(url)
+        if details is not None:
+            return details, 'fresh'
+        content, _ = await self.fetch_content_async(session, url)
+        if content is None:
+            return None, 'failed'
+        # Parsing (or waiting on the parse pool) stays off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._details_from_content, url, content)
+    
+    def _details_from_content(self, url: str, content: bytes) -> Tuple[Dict[str, Any], str]:
+        """Extract details from an event-page body unless the body is unchanged."""
+        page_key = self._page_key(url)
+        content_hash = None
+        if self.parse_cache:
+            content_hash = ParseCache.content_hash(content)
+            fingerprint = self.cache_fingerprint()
+            cached = self.parse_cache.get(page_key, content_hash, fingerprint)
+            if cached is not None and cached['concerts']:
+                return cached['concerts'][0], 'unchanged'
+        
+        if self.parse_executor is not None:
+            future = self.parse_executor.submit(parse_event_in_worker, type(self), self.config, content)
+            details = future.result()
+        else:
+            details = self.parse_event_page(BeautifulSoup(content, self.parser))
+        if self.parse_cache:
+            self.parse_cache.put(page_key, content_hash, fingerprint, [details])
+        return details, 'parsed'
+    
+    def parse_event_page(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract concert details from an event page.
+        Scrapers can override this for venue-specific markup.
+        
+        Args:
+            soup: Parsed event page (full tree, parse_only is not applied)
+            
+        Returns:
+            Dictionary with any of time, price, genre and status (plus
+            status_source)
+        """
+        return extract_event_details(soup, self.enrichment.get('status_selector') or STATUS_SELECTOR)
+    
+    def _build_result(self, crawl: Dict[str, Any], start_time: datetime) -> Dict[str, Any]:
+        """
+        Build the venue result dictionary from a finished crawl.
+        
+        Args:
+            crawl: Bookkeeping state after the last wave
+            start_time: When this scraper run started
+            
+        Returns:
+            Dictionary with venue results and metadata
+        """
+        if crawl['pages'] == 0:
+            return self._create_error_result("Failed to fetch page")
+        
+        concerts = sorted(crawl['concerts'].values(), key=attrgetter('sort_key'))
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        log_msg = (f"Successfully processed {len(concerts)} concerts from "
+                   f"{crawl['pages']} page(s) in {duration:.2f}s")
+        self.logger.info(log_msg)
+        
+        return {
+            'venue_id': self.venue_id,
+            'venue_name': self.venue_name,
+            'concerts': concerts,
+            'metadata': {
+                'total_concerts': len(concerts),
+                'scraped_at': start_time.isoformat(),
+                'duration_seconds': duration,
+                'status': 'success',
+                'pages_fetched': crawl['pages'],
+                'pages_failed': crawl['failed_pages'],
+                'http_cache': crawl['http_cache'],
+                'parse_cache': crawl['parse_cache'],
+                'enrichment': crawl.get('enrichment', {}),
+                'timings': crawl['timings']
+            }
+        }
+    
+    def process_page(self, soup: BeautifulSoup) -> List[Concert]:
+        """
+        Parse, normalize, validate and sort the concerts on a page.
+        
+        Args:
+            soup: Parsed page content
+            
+        Returns:
+            List of normalized concerts sorted by date and time
+        """
+        # Parse concerts
+        raw_concerts = self.parse_concerts(soup)
+        self.logger.info(f"Found {len(raw_concerts)} raw concert entries")
+        
+        # Normalize and validate concerts
+        normalized_concerts = []
+        for raw_concert in raw_concerts:
+            try:
+                normalized = self.normalize_data(raw_concert)
+                if self.validate_concert(normalized):
+                    normalized_concerts.append(normalized)
+                else:
+                    self.logger.warning(f"Invalid concert data: {raw_concert.get('name', 'Unknown')}")
+            except Exception as e:
+                self.logger.error(f"Error normalizing concert: {e}")
+        
+        # Sort concerts by date and time
+        normalized_concerts.sort(key=attrgetter('sort_key'))
+        
+        return normalized_concerts
+    
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create error result dictionary."""
         return {
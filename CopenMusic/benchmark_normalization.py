@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for per-concert normalization cost.
+Compares the original pattern-list date parsing with the compiled
+single-pass version in BaseScraper._normalize_datetime.
+Run with: python3 benchmark_normalization.py [--concerts 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from base_scraper import BaseScraper
+
+
+class BenchmarkScraper(BaseScraper):
+    """Minimal concrete scraper used only to reach the normalization methods."""
+
+    def parse_concerts(self, soup):
+        return []
+
+
+def legacy_normalize_datetime(date_str, time_str):
+    """The original implementation, kept here as the baseline."""
+    date_patterns = [
+        r'(\d{2})\.(\d{2})\.(\d{4})',  # DD.MM.YYYY
+        r'(\d{2})/(\d{2})/(\d{4})',   # DD/MM/YYYY
+        r'(\d{4})-(\d{2})-(\d{2})',   # YYYY-MM-DD
+    ]
+
+    normalized_date = date_str
+    for pattern in date_patterns:
+        match = re.search(pattern, date_str)
+        if match:
+            if pattern.startswith(r'(\d{2})'):  # Danish format
+                day, month, year = match.groups()
+            else:  # ISO format
+                year, month, day = match.groups()
+            normalized_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+            break
+
+    normalized_time = time_str
+    if time_str and ':' not in time_str:
+        if re.match(r'^\d{1,2}$', time_str):
+            normalized_time = f"{time_str.zfill(2)}:00"
+
+    return normalized_date, normalized_time
+
+
+def sample_concerts(count):
+    """Build raw concerts mixing the date and time formats venues produce."""
+    formats = [
+        ('2026-03-{day:02d}', '20:00'),
+        ('{day:02d}.03.2026', '19'),
+        ('{day:02d}/03/2026', '20:30'),
+    ]
+    concerts = []
+    for i in range(count):
+        date_format, time_str = formats[i % len(formats)]
+        concerts.append({
+            'name': f"Artist {i}",
+            'date': date_format.format(day=i % 28 + 1),
+            'time': time_str,
+            'status': 'Tilgængelig',
+            'url': f"https://example.dk/event/artist-{i}/",
+        })
+    return concerts
+
+
+def per_concert_us(func, concerts, repeat):
+    """Return the best time per concert in microseconds."""
+    timings = timeit.repeat(lambda: [func(c) for c in concerts], number=1, repeat=repeat)
+    return min(timings) / len(concerts) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concert normalization')
+    parser.add_argument('--concerts', type=int, default=1000,
+                        help='Number of synthetic concerts to normalize')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Number of timed runs')
+    args = parser.parse_args()
+
+    scraper = BenchmarkScraper({'venue_id': 'benchmark', 'venue_name': 'Benchmark'})
+    concerts = sample_concerts(args.concerts)
+
+    for concert in concerts:
+        expected = legacy_normalize_datetime(concert['date'], concert['time'])
+        assert scraper._normalize_datetime(concert['date'], concert['time']) == expected
+
+    before = per_concert_us(lambda c: legacy_normalize_datetime(c['date'], c['time']),
+                            concerts, args.repeat)
+    after = per_concert_us(lambda c: scraper._normalize_datetime(c['date'], c['time']),
+                           concerts, args.repeat)
+    full = per_concert_us(scraper.normalize_data, concerts, args.repeat)
+
+    print(f"Normalizing {len(concerts)} concerts (best of {args.repeat} runs)")
+    print(f"{'date/time before':<22} {before:>8.2f} µs/concert")
+    print(f"{'date/time after':<22} {after:>8.2f} µs/concert ({before / after:.1f}x)")
+    print(f"{'normalize_data total':<22} {full:>8.2f} µs/concert")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for BeautifulSoup parser backends on saved venue pages.
+Run with: python3 benchmark_parsers.py [--download] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import requests
+import yaml
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from base_scraper import PARSER_BACKENDS, parser_available
+from scrapers import KbHallenScraper, PumpehusetScraper
+
+PAGES = {
+    'kb_hallen': ('kb_hallen.html', KbHallenScraper),
+    'pumpehuset': ('pumpehuset.html', PumpehusetScraper),
+}
+
+
+def download_pages(config_path, pages_dir):
+    """Save fresh copies of the venue pages listed in the configuration."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        venues = yaml.safe_load(f)['venues']
+
+    os.makedirs(pages_dir, exist_ok=True)
+    for venue_id, (filename, _) in PAGES.items():
+        url = venues[venue_id]['url']
+        print(f"Downloading {url}")
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        with open(os.path.join(pages_dir, filename), 'wb') as f:
+            f.write(response.content)
+
+
+def benchmark(content, parser, repeat, parse_only=None):
+    """Return the best and mean time in milliseconds to parse content."""
+    timings = timeit.repeat(lambda: BeautifulSoup(content, parser, parse_only=parse_only),
+                            number=1, repeat=repeat)
+    return min(timings) * 1000, sum(timings) / len(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML parser backends')
+    parser.add_argument('--pages-dir', default='benchmark_pages',
+                        help='Directory with saved venue pages')
+    parser.add_argument('--config', default='venues.yaml',
+                        help='Path to configuration file (used with --download)')
+    parser.add_argument('--download', action='store_true',
+                        help='Download fresh copies of the venue pages first')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Number of timed parses per backend')
+    args = parser.parse_args()
+
+    if args.download:
+        download_pages(args.config, args.pages_dir)
+
+    backends = [name for name in PARSER_BACKENDS if parser_available(name)]
+    missing = [name for name in PARSER_BACKENDS if name not in backends]
+    if missing:
+        print(f"Skipping unavailable backends: {', '.join(missing)}")
+
+    for venue_id, (filename, scraper_class) in PAGES.items():
+        path = os.path.join(args.pages_dir, filename)
+        if not os.path.exists(path):
+            print(f"❌ {path} not found. Run with --download to save the venue pages.")
+            continue
+
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        print(f"\n{venue_id} ({len(content) / 1024:.0f} KB)")
+        print(f"{'backend':<12} {'best ms':>10} {'mean ms':>10} {'strained ms':>12}")
+        for backend in backends:
+            best, mean = benchmark(content, backend, args.repeat)
+            # html5lib ignores parse_only, so there is nothing to compare
+            strained = '-'
+            if backend != 'html5lib' and scraper_class.parse_only is not None:
+                strained_best, _ = benchmark(content, backend, args.repeat, scraper_class.parse_only)
+                strained = f"{strained_best:.2f}"
+            print(f"{backend:<12} {best:>10.2f} {mean:>10.2f} {strained:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Per-concert diffing between scraping runs.
+Compares the previous snapshot with the current one by concert id and
+produces a compact change feed of added, removed and changed concerts.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+# Concert fields compared between runs (id and venue are part of the key)
+TRACKED_FIELDS = ('name', 'date', 'time', 'status', 'url', 'support', 'genre', 'price')
+
+
+def index_concerts(concerts: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Key concerts by their id."""
+    return {concert['id']: concert for concert in concerts if concert.get('id')}
+
+
+def load_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the previous run's concerts from a concerts.json snapshot.
+
+    Args:
+        path: Path to the snapshot
+
+    Returns:
+        Dictionary with last_updated and concerts keyed by id, or None if
+        there is no readable snapshot
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    return {
+        'last_updated': data.get('last_updated'),
+        'concerts': index_concerts(data.get('all_concerts', [])),
+    }
+
+
+def diff_concerts(previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                  scraped_venues: Optional[Iterable[str]] = None) -> Dict[str, List[Any]]:
+    """
+    Diff two sets of concerts keyed by id.
+
+    Concerts of venues that were not scraped successfully this run are not
+    reported as removed, so a failing scraper does not empty the feed.
+
+    Args:
+        previous: Concerts from the previous run, keyed by id
+        current: Concerts from this run, keyed by id
+        scraped_venues: Venue IDs scraped successfully this run (all if None)
+
+    Returns:
+        Dictionary with added (concerts), removed (ids) and changed
+        (id plus {field: [old, new]}) lists
+    """
+    venues = set(scraped_venues) if scraped_venues is not None else None
+
+    added = [concert for concert_id, concert in current.items() if concert_id not in previous]
+    removed = [
+        concert_id for concert_id, concert in previous.items()
+        if concert_id not in current and (venues is None or concert.get('venue') in venues)
+    ]
+
+    changed = []
+    for concert_id, concert in current.items():
+        old = previous.get(concert_id)
+        if old is None:
+            continue
+        changes = {
+            field: [old.get(field), concert.get(field)]
+            for field in TRACKED_FIELDS
+            if old.get(field) != concert.get(field)
+        }
+        if changes:
+            changed.append({'id': concert_id, 'changes': changes})
+
+    return {'added': added, 'removed': removed, 'changed': changed}
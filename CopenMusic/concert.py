@@ -0,0 +1,64 @@
+"""
+Compact record type for normalized concerts.
+Concerts travel through the pipeline as slotted dataclass instances with a
+precomputed sort key, and are only turned into dictionaries when written
+to the parse cache, the store or the output files.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+# Serialized field order, matching the historical concert dictionaries
+FIELDS = ('id', 'name', 'date', 'time', 'status', 'url', 'support',
+          'genre', 'price', 'venue', 'venue_name')
+
+
+@dataclass(slots=True)
+class Concert:
+    """A normalized concert."""
+
+    id: str
+    name: str
+    date: str
+    time: str
+    status: str
+    url: str = ''
+    support: str = ''
+    genre: str = ''
+    price: Optional[str] = None
+    venue: str = ''
+    venue_name: str = ''
+    raw_data: Optional[Dict[str, Any]] = None
+    sort_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.refresh_sort_key()
+
+    def refresh_sort_key(self) -> None:
+        """Recompute the sort key after date or time was changed."""
+        self.sort_key = (self.date or '', self.time or '')
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Concert':
+        """
+        Build a concert from its dictionary form.
+
+        Args:
+            data: Concert dictionary, e.g. from the parse cache or the store
+
+        Returns:
+            Concert instance (unknown keys are ignored)
+        """
+        return cls(**{key: data[key] for key in (*FIELDS, 'raw_data') if key in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the concert.
+
+        Returns:
+            Dictionary with the concert fields; raw_data only if present
+        """
+        data = {key: getattr(self, key) for key in FIELDS}
+        if self.raw_data is not None:
+            data['raw_data'] = self.raw_data
+        return data
@@ -0,0 +1,156 @@
+"""
+In-memory query index over a concerts.json snapshot.
+Built once per snapshot: concerts are sorted by date, so date ranges are
+found by bisection, and venue and status filters walk precomputed
+position lists instead of scanning every concert.
+"""
+
+import base64
+import binascii
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+# URL parameters understood by parse_query(); any other parameter (such as
+# a cache-buster) leaves the full snapshot as the response
+QUERY_PARAMS = ('venue', 'status', 'from', 'to', 'limit', 'cursor')
+
+
+class QueryError(ValueError):
+    """Raised for invalid query parameters."""
+
+
+def encode_cursor(key: Tuple[str, str, str]) -> str:
+    """Encode a sort key as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode('\x1f'.join(key).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, str]:
+    """Decode a cursor from encode_cursor()."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8').split('\x1f')
+    except (binascii.Error, UnicodeError, ValueError):
+        raise QueryError('invalid cursor')
+    if len(parts) != 3:
+        raise QueryError('invalid cursor')
+    return parts[0], parts[1], parts[2]
+
+
+def parse_query(params: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Turn URL query parameters into ConcertIndex.query() arguments.
+
+    Args:
+        params: Output of urllib.parse.parse_qs()
+
+    Returns:
+        Keyword arguments for query()
+
+    Raises:
+        QueryError: If a date or limit is malformed
+    """
+    def first(name: str) -> Optional[str]:
+        values = params.get(name)
+        return values[0] if values else None
+
+    query = {
+        'venue': first('venue'),
+        'status': first('status'),
+        'date_from': first('from'),
+        'date_to': first('to'),
+        'cursor': first('cursor'),
+    }
+    for name in ('date_from', 'date_to'):
+        if query[name] is not None:
+            try:
+                datetime.strptime(query[name], '%Y-%m-%d')
+            except ValueError:
+                raise QueryError(f"{name.replace('date_', '')} must be a date (YYYY-MM-DD)")
+
+    limit = first('limit')
+    if limit is not None:
+        try:
+            query['limit'] = int(limit)
+        except ValueError:
+            raise QueryError('limit must be an integer')
+    return query
+
+
+class ConcertIndex:
+    """Concerts sorted by (date, time, id) with venue and status position lists."""
+
+    def __init__(self, concerts: List[Dict[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            concerts: Concert dictionaries (e.g. all_concerts of concerts.json)
+        """
+        self.concerts = sorted(concerts, key=self._key)
+        self.keys = [self._key(concert) for concert in self.concerts]
+        self.dates = [key[0] for key in self.keys]
+        self.by_venue: Dict[str, List[int]] = {}
+        self.by_status: Dict[str, List[int]] = {}
+        for position, concert in enumerate(self.concerts):
+            self.by_venue.setdefault(concert.get('venue', ''), []).append(position)
+            self.by_status.setdefault(concert.get('status', ''), []).append(position)
+
+    @staticmethod
+    def _key(concert: Dict[str, Any]) -> Tuple[str, str, str]:
+        return (concert.get('date') or '', concert.get('time') or '', concert.get('id') or '')
+
+    def query(self, venue: Optional[str] = None, status: Optional[str] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None,
+              limit: int = DEFAULT_LIMIT, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find concerts in date order.
+
+        Args:
+            venue: Venue ID
+            status: Standard status, e.g. sold_out
+            date_from: First date (YYYY-MM-DD), inclusive
+            date_to: Last date (YYYY-MM-DD), inclusive
+            limit: Page size (at most MAX_LIMIT)
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Dictionary with concerts and next_cursor (None on the last page)
+        """
+        lo = bisect_left(self.dates, date_from) if date_from else 0
+        hi = bisect_right(self.dates, date_to) if date_to else len(self.dates)
+        if cursor:
+            lo = max(lo, bisect_right(self.keys, decode_cursor(cursor)))
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        # Walk the shortest position list; check the other filter per concert
+        postings = []
+        if venue is not None:
+            postings.append(self.by_venue.get(venue, []))
+        if status is not None:
+            postings.append(self.by_status.get(status, []))
+        if postings:
+            positions = min(postings, key=len)
+            candidates = positions[bisect_left(positions, lo):bisect_left(positions, hi)]
+        else:
+            candidates = range(lo, hi)
+
+        results = []
+        next_cursor = None
+        for position in candidates:
+            concert = self.concerts[position]
+            if venue is not None and concert.get('venue') != venue:
+                continue
+            if status is not None and concert.get('status') != status:
+                continue
+            if len(results) == limit:
+                next_cursor = encode_cursor(self.keys[results[-1]])
+                break
+            results.append(position)
+
+        return {
+            'concerts': [self.concerts[position] for position in results],
+            'next_cursor': next_cursor,
+        }
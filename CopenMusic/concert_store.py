@@ -0,0 +1,244 @@
+"""
+SQLite-backed concert store.
+Holds the current concerts of every venue with indexes on date, venue and
+status, so the orchestrator can upsert each run and consumers can query
+without loading the whole JSON snapshot.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from concert import Concert, FIELDS as CONCERT_FIELDS
+
+# Concert fields are stored as columns; anything else (e.g. raw_data) goes
+# into the extra JSON column
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS concerts (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT,
+    status TEXT,
+    url TEXT,
+    support TEXT,
+    genre TEXT,
+    price TEXT,
+    venue TEXT NOT NULL,
+    venue_name TEXT,
+    extra TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_concerts_date ON concerts (date, time);
+CREATE INDEX IF NOT EXISTS idx_concerts_venue_date ON concerts (venue, date);
+CREATE INDEX IF NOT EXISTS idx_concerts_status_date ON concerts (status, date);
+
+CREATE TABLE IF NOT EXISTS venues (
+    venue_id TEXT PRIMARY KEY,
+    venue_name TEXT,
+    metadata TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    scraped_at TEXT PRIMARY KEY,
+    metadata TEXT NOT NULL
+);
+"""
+
+
+class ConcertStore:
+    """Concerts of the latest successful scrape of each venue, in SQLite."""
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['ConcertStore']:
+        """
+        Build a store from the global storage configuration section.
+
+        Args:
+            config: Mapping with backend and path
+
+        Returns:
+            ConcertStore instance, or None unless the backend is sqlite
+        """
+        if not config or config.get('backend', 'files') != 'sqlite':
+            return None
+        return cls(config.get('path', 'data/concerts.db'))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def save_run(self, data: Dict[str, Any]) -> None:
+        """
+        Upsert one run's unified data.
+
+        Venues that were scraped successfully replace their concert set:
+        new and updated concerts are upserted and concerts no longer listed
+        are deleted. Failed venues keep the concerts from their last good run.
+
+        Args:
+            data: Unified data structure from generate_unified_data()
+        """
+        now = datetime.now().isoformat()
+        with self.connection:
+            for venue_id, venue_data in data['venues'].items():
+                if venue_data['metadata']['status'] != 'success':
+                    continue
+
+                rows = [self._to_row(concert.to_dict(), now) for concert in venue_data['concerts']]
+                self.connection.executemany(
+                    f"""
+                    INSERT INTO concerts ({', '.join(CONCERT_FIELDS)}, extra, updated_at)
+                    VALUES ({', '.join('?' * (len(CONCERT_FIELDS) + 2))})
+                    ON CONFLICT(id) DO UPDATE SET
+                    {', '.join(f'{field} = excluded.{field}' for field in CONCERT_FIELDS[1:])},
+                    extra = excluded.extra, updated_at = excluded.updated_at
+                    """,
+                    rows
+                )
+
+                ids = [row[0] for row in rows]
+                self.connection.execute(
+                    f"DELETE FROM concerts WHERE venue = ? AND id NOT IN ({', '.join('?' * len(ids))})",
+                    [venue_id, *ids]
+                )
+
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO venues (venue_id, venue_name, metadata) VALUES (?, ?, ?)",
+                    (venue_id, venue_data['venue_name'], json.dumps(venue_data['metadata'], ensure_ascii=False))
+                )
+
+            # Failed venues are recorded so outputs show the failure
+            for venue_id, venue_data in data['venues'].items():
+                if venue_data['metadata']['status'] == 'success':
+                    continue
+                self.connection.execute(
+                    """
+                    INSERT INTO venues (venue_id, venue_name, metadata) VALUES (?, ?, ?)
+                    ON CONFLICT(venue_id) DO UPDATE SET metadata = excluded.metadata
+                    """,
+                    (venue_id, venue_data['venue_name'], json.dumps(venue_data['metadata'], ensure_ascii=False))
+                )
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO runs (scraped_at, metadata) VALUES (?, ?)",
+                (data['last_updated'], json.dumps(data['metadata'], ensure_ascii=False))
+            )
+
+    def query(self, venue: Optional[str] = None, status: Optional[str] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Concert]:
+        """
+        Find concerts, ordered by date and time.
+
+        Args:
+            venue: Venue ID
+            status: Standard status, e.g. sold_out
+            date_from: First date (YYYY-MM-DD), inclusive
+            date_to: Last date (YYYY-MM-DD), inclusive
+            limit: Maximum number of concerts
+
+        Returns:
+            List of concerts
+        """
+        clauses, params = [], []
+        for clause, value in (('venue = ?', venue), ('status = ?', status),
+                              ('date >= ?', date_from), ('date <= ?', date_to)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT * FROM concerts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date, time"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [self._from_row(row) for row in self.connection.execute(sql, params)]
+
+    def load_unified(self, venue_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Rebuild the unified data structure from the store.
+
+        Args:
+            venue_ids: Venues to include, in order (defaults to every stored venue)
+
+        Returns:
+            Unified data structure, as produced by generate_unified_data()
+        """
+        run = self.connection.execute(
+            "SELECT scraped_at, metadata FROM runs ORDER BY scraped_at DESC LIMIT 1"
+        ).fetchone()
+        stored_venues = {
+            row['venue_id']: row
+            for row in self.connection.execute("SELECT * FROM venues")
+        }
+        if venue_ids is None:
+            venue_ids = sorted(stored_venues)
+
+        venues_data = {}
+        for venue_id in venue_ids:
+            row = stored_venues.get(venue_id)
+            if row is None:
+                continue
+            venues_data[venue_id] = {
+                'venue_name': row['venue_name'],
+                'concerts': [],
+                'metadata': json.loads(row['metadata'])
+            }
+
+        # One ordered scan; venue lists and upcoming share the same objects
+        all_concerts = []
+        for concert in self.query():
+            if concert.venue in venues_data:
+                venues_data[concert.venue]['concerts'].append(concert)
+                all_concerts.append(concert)
+        today = datetime.now().strftime('%Y-%m-%d')
+        upcoming_concerts = [concert for concert in all_concerts if concert.date >= today]
+
+        metadata = json.loads(run['metadata']) if run else {}
+        return {
+            'last_updated': run['scraped_at'] if run else None,
+            'metadata': {
+                **metadata,
+                'total_concerts': len(all_concerts),
+                'upcoming_concerts': len(upcoming_concerts),
+                'venues_count': len(venues_data)
+            },
+            'venues': venues_data,
+            'all_concerts': all_concerts,
+            'upcoming': upcoming_concerts
+        }
+
+    @staticmethod
+    def _to_row(concert: Dict[str, Any], updated_at: str) -> tuple:
+        extra = {key: value for key, value in concert.items() if key not in CONCERT_FIELDS}
+        return (
+            *(concert.get(field) for field in CONCERT_FIELDS),
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+            updated_at
+        )
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Concert:
+        # Fields kept in extra (e.g. raw_data) are not carried back
+        return Concert.from_dict({field: row[field] for field in CONCERT_FIELDS})
@@ -0,0 +1,177 @@
+"""
+Danish calendar helpers shared by the venue scrapers.
+Resolves listing entries like "25.Onsdag" to ISO dates by direct
+computation, memoized so each distinct entry is only resolved once.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import patterns
+
+WEEKDAYS = {
+    'mandag': 0, 'monday': 0,
+    'tirsdag': 1, 'tuesday': 1,
+    'onsdag': 2, 'wednesday': 2,
+    'torsdag': 3, 'thursday': 3,
+    'fredag': 4, 'friday': 4,
+    'lørdag': 5, 'saturday': 5,
+    'søndag': 6, 'sunday': 6
+}
+
+# Danish month names and abbreviations
+MONTHS = {
+    'jan': 1, 'januar': 1,
+    'feb': 2, 'februar': 2,
+    'mar': 3, 'marts': 3,
+    'apr': 4, 'april': 4,
+    'maj': 5,
+    'jun': 6, 'juni': 6,
+    'jul': 7, 'juli': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'september': 9,
+    'okt': 10, 'oktober': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12
+}
+
+# Search horizon, in months, for entries without a month header. If no
+# date within it has the listed weekday, parse_danish_date takes the next
+# date with that day regardless of weekday, and today if there is none.
+MAX_MONTHS_AHEAD = 28
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _add_months(year: int, month: int, offset: int) -> Tuple[int, int]:
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+def reference_month(month: int, year: Optional[int] = None, today: Optional[date] = None) -> Tuple[int, int]:
+    """
+    Complete a month header to a (year, month) reference.
+
+    Headers without a year are taken to be the next occurrence of that
+    month, since venue calendars only list upcoming events.
+
+    Args:
+        month: Month number from the header
+        year: Year from the header, if shown
+        today: Date to resolve against (defaults to today)
+
+    Returns:
+        Tuple of (year, month)
+    """
+    if year is None:
+        today = today or date.today()
+        year = today.year if month >= today.month else today.year + 1
+    return year, month
+
+
+def month_header_reference(month_text: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the (year, month) of a K.B. Hallen list-month block from its header.
+
+    Args:
+        month_text: Text of the block
+
+    Returns:
+        Tuple of (year, month), or None if the block has no month header
+    """
+    # The header precedes the first concert entry in the block
+    first_entry = patterns.KB_CONCERT_ENTRY.search(month_text)
+    header_text = month_text[:first_entry.start()] if first_entry else month_text
+    header_match = patterns.MONTH_HEADER.search(header_text)
+    if not header_match:
+        return None
+    month_name, year = header_match.groups()
+    return reference_month(MONTHS[month_name.lower()], int(year) if year else None)
+
+
+@lru_cache(maxsize=4096)
+def resolve_in_month(day: int, weekday: Optional[int], reference: Tuple[int, int]) -> Optional[str]:
+    """
+    Resolve a day number listed under a known month header.
+
+    If the weekday does not match the header year (e.g. a year-less header
+    was guessed wrong), the following year is tried before trusting the
+    header as-is.
+
+    Args:
+        day: Day of month
+        weekday: Weekday number (Monday = 0), or None if unknown
+        reference: (year, month) of the surrounding month header
+
+    Returns:
+        ISO date string, or None if the day does not exist in that month
+    """
+    year, month = reference
+    candidate = _safe_date(year, month, day)
+    if candidate is None:
+        return None
+    if weekday is not None and candidate.weekday() != weekday:
+        next_year = _safe_date(year + 1, month, day)
+        if next_year is not None and next_year.weekday() == weekday:
+            candidate = next_year
+    return candidate.isoformat()
+
+
+@lru_cache(maxsize=4096)
+def resolve_upcoming(day: int, weekday: Optional[int], today: date) -> Optional[str]:
+    """
+    Resolve a day and weekday to the next matching date on or after today.
+
+    Used when the entry has no surrounding month header.
+
+    Args:
+        day: Day of month
+        weekday: Weekday number (Monday = 0), or None if unknown
+        today: Date to resolve against
+
+    Returns:
+        ISO date string, or None if no month has that day
+    """
+    for offset in range(MAX_MONTHS_AHEAD):
+        year, month = _add_months(today.year, today.month, offset)
+        candidate = _safe_date(year, month, day)
+        if candidate is None or candidate < today:
+            continue
+        if weekday is None or candidate.weekday() == weekday:
+            return candidate.isoformat()
+    return None
+
+
+def parse_danish_date(day: str, weekday: str, reference: Optional[Tuple[int, int]] = None,
+                      today: Optional[date] = None) -> str:
+    """
+    Parse a Danish listing day and weekday (e.g. "25", "Onsdag") to ISO format.
+
+    Args:
+        day: Day of month as text
+        weekday: Danish or English weekday name
+        reference: (year, month) of the surrounding month header, if known
+        today: Date to resolve against (defaults to today)
+
+    Returns:
+        ISO date string (YYYY-MM-DD)
+    """
+    day_num = int(day)
+    weekday_num = WEEKDAYS.get(weekday.strip().lower())
+    today = today or date.today()
+
+    resolved = None
+    if reference is not None:
+        resolved = resolve_in_month(day_num, weekday_num, reference)
+    if resolved is None:
+        resolved = resolve_upcoming(day_num, weekday_num, today)
+    if resolved is None:
+        # Nothing matches the weekday: fall back to the next date with that day
+        resolved = resolve_upcoming(day_num, None, today)
+    return resolved or today.isoformat()
@@ -0,0 +1,183 @@
+"""
+Detail-page enrichment for normalized concerts.
+Extracts time, price, genre and ticket status from a venue's event page,
+preferring schema.org Event data (JSON-LD) and falling back to page text.
+Status is only read from offer availability or the event's own ticket
+element, never from the page text as a whole, which also lists other
+events.
+"""
+
+import json
+from typing import Any, Dict, Iterator, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+import patterns
+from concert import Concert
+
+# schema.org offer availability values mapped to the venue status words
+AVAILABILITY_STATUS = {
+    'soldout': 'Udsolgt',
+    'limitedavailability': 'Få billetter',
+    'instock': 'Tilgængelig',
+}
+
+# Elements holding the event's own ticket status
+STATUS_SELECTOR = '[class*="ticket-status"], [class*="event-status"], .status, .tickets, .billetter'
+# Blocks listing other events, whose statuses must not be picked up
+UNRELATED_BLOCKS = ('aside', 'footer', 'nav')
+UNRELATED_CLASS_WORDS = ('related', 'recommend', 'other-events', 'more-events')
+
+# Status words in the order they are checked
+STATUS_WORDS = (
+    ('udsolgt', 'Udsolgt'),
+    ('sold out', 'Udsolgt'),
+    ('venteliste', 'Venteliste'),
+    ('få billetter', 'Få billetter'),
+)
+
+
+def _json_ld_events(soup: BeautifulSoup) -> Iterator[Dict[str, Any]]:
+    """Yield every schema.org Event object embedded as JSON-LD."""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                item_type = item.get('@type', '')
+                types = item_type if isinstance(item_type, list) else [item_type]
+                if any(str(t).endswith('Event') for t in types):
+                    yield item
+                stack.extend(item.get('@graph', []))
+
+
+def _details_from_json_ld(event: Dict[str, Any]) -> Dict[str, Any]:
+    details = {}
+
+    start = str(event.get('startDate', ''))
+    time_match = patterns.ISO_TIME.search(start)
+    if time_match:
+        details['time'] = f"{time_match.group(1)}:{time_match.group(2)}"
+
+    offers = event.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if isinstance(offers, dict):
+        price = offers.get('price') or offers.get('lowPrice')
+        if price not in (None, ''):
+            currency = offers.get('priceCurrency', 'DKK')
+            details['price'] = f"{price} {currency}".strip()
+        availability = str(offers.get('availability', '')).rsplit('/', 1)[-1].lower()
+        if availability in AVAILABILITY_STATUS:
+            details['status'] = AVAILABILITY_STATUS[availability]
+            details['status_source'] = 'offers'
+
+    genre = event.get('genre')
+    if isinstance(genre, list):
+        genre = ', '.join(str(g) for g in genre)
+    if genre:
+        details['genre'] = str(genre).strip()
+
+    return details
+
+
+def _details_from_text(text: str) -> Dict[str, Any]:
+    details = {}
+
+    time_match = patterns.EVENT_TIME.search(text)
+    if time_match:
+        details['time'] = f"{time_match.group(1).zfill(2)}:{time_match.group(2)}"
+
+    price_match = patterns.EVENT_PRICE.search(text)
+    if price_match:
+        details['price'] = f"{price_match.group(1)} DKK"
+
+    genre_match = patterns.EVENT_GENRE.search(text)
+    if genre_match:
+        details['genre'] = genre_match.group(1).strip()
+
+    return details
+
+
+def _is_unrelated(element: Tag) -> bool:
+    """Whether an element sits in a block about other events."""
+    for parent in element.parents:
+        if parent.name in UNRELATED_BLOCKS:
+            return True
+        classes = ' '.join(parent.get('class') or []).lower()
+        if any(word in classes for word in UNRELATED_CLASS_WORDS):
+            return True
+    return False
+
+
+def _status_from_element(soup: BeautifulSoup, selector: str) -> Optional[str]:
+    """Read the status from the first ticket element of the event itself."""
+    for element in soup.select(selector):
+        if _is_unrelated(element):
+            continue
+        text = element.get_text(' ').lower()
+        for word, status in STATUS_WORDS:
+            if word in text:
+                return status
+    return None
+
+
+def extract_event_details(soup: BeautifulSoup, status_selector: str = STATUS_SELECTOR) -> Dict[str, Any]:
+    """
+    Extract concert details from an event page.
+
+    Args:
+        soup: Parsed event page
+        status_selector: CSS selector of the event's ticket status element
+
+    Returns:
+        Dictionary with any of time, price, genre and status (raw venue
+        wording), plus status_source ('offers' or 'element') with status
+    """
+    details = _details_from_text(soup.get_text('\n'))
+    status = _status_from_element(soup, status_selector)
+    if status:
+        details['status'] = status
+        details['status_source'] = 'element'
+    event = next(_json_ld_events(soup), None)
+    if event is not None:
+        details.update(_details_from_json_ld(event))
+    return details
+
+
+def merge_details(concert: Concert, details: Dict[str, Any], default_time: Optional[str],
+                  default_status: Optional[str], normalize_status) -> None:
+    """
+    Fill a normalized concert in place with details from its event page.
+
+    Listing data wins where the listing is authoritative: time is only
+    replaced when it is missing or the scraper's placeholder, and genre and
+    price only when empty. A status from the event's offer availability
+    (JSON-LD) replaces the listing's; one read from a ticket element only
+    replaces a missing status or the scraper's placeholder.
+
+    Args:
+        concert: Normalized concert
+        details: Output of extract_event_details()
+        default_time: Placeholder time the scraper uses when none is listed
+        default_status: Placeholder status the scraper uses when none is listed
+        normalize_status: Function mapping venue status words to standard values
+    """
+    if details.get('time') and concert.time in ('', None, default_time):
+        concert.time = details['time']
+        concert.refresh_sort_key()
+    if details.get('price') and concert.price in ('', None):
+        concert.price = details['price']
+    if details.get('genre') and not concert.genre:
+        concert.genre = details['genre']
+    placeholder_status = normalize_status(default_status) if default_status else None
+    if details.get('status') and (details.get('status_source') == 'offers'
+                                  or concert.status in ('', None, placeholder_status)):
+        concert.status = normalize_status(details['status'])
@@ -0,0 +1,206 @@
+"""
+On-disk HTTP cache with conditional-GET support for venue pages.
+Stores response bodies together with their ETag / Last-Modified validators
+so unchanged pages can be revalidated with a cheap 304 response.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class HttpCache:
+    """File-backed cache of response bodies keyed by URL."""
+
+    # One instance per directory, so scrapers sharing a cache directory
+    # also share its in-memory size accounting
+    _instances: Dict[str, 'HttpCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory: str, max_size_mb: float = 50, ttl_seconds: int = 7 * 24 * 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding cached bodies and metadata
+            max_size_mb: Total body size before the oldest entries are evicted
+            ttl_seconds: Age after which an entry is discarded instead of revalidated
+        """
+        self.directory = directory
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # url -> (stored_at, size), read from disk on the first store()
+        self._entries: Optional[Dict[str, Tuple[float, int]]] = None
+        self._total_size = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['HttpCache']:
+        """
+        Build a cache from the global cache.http configuration section.
+
+        Args:
+            config: Mapping with enabled, directory, max_size_mb and ttl_seconds
+
+        Returns:
+            HttpCache instance, or None if caching is disabled
+        """
+        if not config or not config.get('enabled', False):
+            return None
+        directory = config.get('directory', '.cache/http')
+        with cls._instances_lock:
+            if directory not in cls._instances:
+                cls._instances[directory] = cls(
+                    directory,
+                    max_size_mb=config.get('max_size_mb', 50),
+                    ttl_seconds=config.get('ttl_seconds', 7 * 24 * 3600),
+                )
+            return cls._instances[directory]
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached metadata for a URL if it exists and has not expired.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Metadata dictionary (etag, last_modified, stored_at) or None
+        """
+        meta_path = self._path(url, 'json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if time.time() - meta.get('stored_at', 0) > self.ttl_seconds:
+            self._remove(url)
+            return None
+        if not os.path.exists(self._path(url, 'body')):
+            return None
+        return meta
+
+    @staticmethod
+    def conditional_headers(meta: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from cached metadata."""
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def read_body(self, url: str) -> Optional[bytes]:
+        """Read the cached response body for a URL."""
+        try:
+            with open(self._path(url, 'body'), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Store a fresh response body and its validators.
+
+        Responses without an ETag or Last-Modified header are not cached,
+        since they can never be revalidated.
+
+        Args:
+            url: Requested URL
+            body: Raw response body
+            headers: Response headers
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        stored_at = time.time()
+        self._write(self._path(url, 'body'), body)
+        self._write_meta(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+            'size': len(body),
+        })
+        with self._lock:
+            self._track(url, stored_at, len(body))
+            self._evict()
+
+    def refresh(self, url: str, meta: Dict[str, Any]) -> None:
+        """Mark a cached entry as freshly revalidated after a 304 response."""
+        meta = {**meta, 'stored_at': time.time()}
+        self._write_meta(url, meta)
+        with self._lock:
+            if self._entries is not None and url in self._entries:
+                self._entries[url] = (meta['stored_at'], self._entries[url][1])
+
+    def _write_meta(self, url: str, meta: Dict[str, Any]) -> None:
+        self._write(self._path(url, 'json'), json.dumps(meta).encode('utf-8'))
+
+    def _write(self, path: str, data: bytes) -> None:
+        # Write to a temp file and rename so concurrent readers never see partial data
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, url: str) -> None:
+        for suffix in ('body', 'json'):
+            try:
+                os.remove(self._path(url, suffix))
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            if self._entries is not None and url in self._entries:
+                self._total_size -= self._entries.pop(url)[1]
+
+    def _load_entries(self) -> None:
+        """Read every entry's metadata once to seed the in-memory index."""
+        self._entries = {}
+        self._total_size = 0
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self._track(meta['url'], meta.get('stored_at', 0), meta.get('size', 0))
+
+    def _track(self, url: str, stored_at: float, size: int) -> None:
+        """Add or replace an entry in the in-memory index (lock held)."""
+        if self._entries is None:
+            self._load_entries()
+        previous = self._entries.get(url)
+        if previous is not None:
+            self._total_size -= previous[1]
+        self._entries[url] = (stored_at, size)
+        self._total_size += size
+
+    def _evict(self) -> None:
+        """Drop the oldest entries until the cache fits in max_size_bytes (lock held)."""
+        if self._total_size <= self.max_size_bytes:
+            return
+        for url, (_, size) in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            if self._total_size <= self.max_size_bytes:
+                break
+            for suffix in ('body', 'json'):
+                try:
+                    os.remove(self._path(url, suffix))
+                except FileNotFoundError:
+                    pass
+            del self._entries[url]
+            self._total_size -= size
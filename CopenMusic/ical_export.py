@@ -0,0 +1,210 @@
+"""
+iCalendar (RFC 5545) feeds for concerts.
+Events get stable UIDs derived from the concert id, so calendar clients
+update existing events instead of duplicating them, and each feed carries
+a content hash so unchanged feeds are not rewritten.
+"""
+
+import hashlib
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional
+
+from concert import Concert
+from output_writers import atomic_write
+
+PRODID = '-//CopenMusic//Concert Listings//EN'
+UID_DOMAIN = 'copenmusic'
+TIMEZONE = 'Europe/Copenhagen'
+EVENT_DURATION = timedelta(hours=3)
+HASH_PROPERTY = 'X-COPENMUSIC-CONTENT-HASH'
+
+STATUS_LABELS = {
+    'available': 'Available',
+    'few_tickets': 'Few tickets left',
+    'waiting_list': 'Waiting list',
+    'sold_out': 'Sold out',
+}
+
+# Central European time with EU daylight saving rules
+VTIMEZONE = [
+    'BEGIN:VTIMEZONE',
+    f'TZID:{TIMEZONE}',
+    'BEGIN:DAYLIGHT',
+    'TZOFFSETFROM:+0100',
+    'TZOFFSETTO:+0200',
+    'TZNAME:CEST',
+    'DTSTART:19700329T020000',
+    'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU',
+    'END:DAYLIGHT',
+    'BEGIN:STANDARD',
+    'TZOFFSETFROM:+0200',
+    'TZOFFSETTO:+0100',
+    'TZNAME:CET',
+    'DTSTART:19701025T030000',
+    'RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU',
+    'END:STANDARD',
+    'END:VTIMEZONE',
+]
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT property value."""
+    return (text.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def _fold(line: str) -> str:
+    """Fold a content line to at most 75 octets per physical line."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return '\r\n '.join(parts)
+
+
+def _event_day(concert: Concert) -> Optional[date]:
+    try:
+        return datetime.strptime(concert.date, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _event_start(concert: Concert) -> Optional[datetime]:
+    try:
+        return datetime.strptime(f"{concert.date} {concert.time}", '%Y-%m-%d %H:%M')
+    except ValueError:
+        return None
+
+
+def event_lines(concert: Concert, stamp: str) -> List[str]:
+    """
+    Build the VEVENT for a concert.
+
+    Args:
+        concert: Normalized concert
+        stamp: DTSTAMP value (UTC, e.g. 20260223T130000Z)
+
+    Returns:
+        Unfolded content lines, or an empty list if the concert's date is
+        not a valid ISO date
+    """
+    day = _event_day(concert)
+    if day is None:
+        return []
+
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{concert.id}@{UID_DOMAIN}',
+        f'DTSTAMP:{stamp}',
+    ]
+
+    start = _event_start(concert)
+    if start is not None:
+        end = start + EVENT_DURATION
+        lines.append(f'DTSTART;TZID={TIMEZONE}:{start:%Y%m%dT%H%M%S}')
+        lines.append(f'DTEND;TZID={TIMEZONE}:{end:%Y%m%dT%H%M%S}')
+    else:
+        lines.append(f'DTSTART;VALUE=DATE:{day:%Y%m%d}')
+
+    summary = concert.name
+    if concert.status == 'sold_out':
+        summary = f"{summary} (sold out)"
+    lines.append(f'SUMMARY:{_escape(summary)}')
+    lines.append(f'LOCATION:{_escape(concert.venue_name)}')
+
+    description = [f"Status: {STATUS_LABELS.get(concert.status, concert.status)}"]
+    if concert.support:
+        description.append(f"Support: {concert.support}")
+    if concert.genre:
+        description.append(f"Genre: {concert.genre}")
+    if concert.price:
+        description.append(f"Price: {concert.price}")
+    lines.append(f"DESCRIPTION:{_escape(chr(10).join(description))}")
+
+    if concert.url:
+        lines.append(f'URL:{concert.url}')
+    lines.append('END:VEVENT')
+    return lines
+
+
+def build_calendar(name: str, concerts: Iterable[Concert], stamp: str) -> str:
+    """
+    Build a calendar feed.
+
+    The content hash covers everything except DTSTAMP values, so a feed
+    whose events did not change hashes the same on every run.
+
+    Args:
+        name: Calendar name shown by clients
+        concerts: Concerts to include (those without a valid date are skipped)
+        stamp: DTSTAMP value for every event
+
+    Returns:
+        Feed text with CRLF line endings
+    """
+    events = []
+    for concert in concerts:
+        events.extend(event_lines(concert, stamp))
+
+    digest = hashlib.sha256()
+    for line in [name, *events]:
+        if not line.startswith('DTSTAMP:'):
+            digest.update(line.encode('utf-8') + b'\n')
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{_escape(name)}',
+        f'X-WR-TIMEZONE:{TIMEZONE}',
+        f'{HASH_PROPERTY}:{digest.hexdigest()}',
+        *VTIMEZONE,
+        *events,
+        'END:VCALENDAR',
+    ]
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
+
+
+def feed_hash(text: str) -> Optional[str]:
+    """Read the content hash property from a feed's header."""
+    for line in text.split('\r\n', 10)[:10]:
+        if line.startswith(f'{HASH_PROPERTY}:'):
+            return line.split(':', 1)[1]
+    return None
+
+
+def write_if_changed(path: str, text: str) -> bool:
+    """
+    Write a feed unless the file on disk has the same content hash.
+
+    Args:
+        path: Feed file
+        text: Output of build_calendar()
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            current = f.read(4096)
+    except FileNotFoundError:
+        current = ''
+
+    new_hash = feed_hash(text)
+    if new_hash is not None and feed_hash(current) == new_hash:
+        return False
+
+    with atomic_write(path, newline='') as f:
+        f.write(text)
+    return True
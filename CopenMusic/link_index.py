@@ -0,0 +1,78 @@
+"""
+Index of event links on a listing page, for matching concerts to their URLs.
+Built once per page so each lookup costs a hash probe instead of a scan
+over every link on the page.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# Number of leading characters of each word used as a fuzzy-match key
+PREFIX_LENGTH = 3
+
+
+def normalize_title(text: str) -> str:
+    """Lowercase a title and collapse its whitespace."""
+    return ' '.join(text.lower().split())
+
+
+class EventLinkIndex:
+    """Maps event titles to URLs with exact and fuzzy (substring) lookups."""
+
+    def __init__(self):
+        self._exact: Dict[str, str] = {}
+        self._entries: List[Tuple[str, str]] = []
+        self._by_prefix: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, text: str, url: str) -> None:
+        """
+        Register an event link. The first URL seen for a title wins.
+
+        Args:
+            text: Link text (event title)
+            url: Absolute event URL
+        """
+        title = normalize_title(text)
+        if not title or title in self._exact:
+            return
+
+        self._exact[title] = url
+        position = len(self._entries)
+        self._entries.append((title, url))
+        for prefix in {word[:PREFIX_LENGTH] for word in title.split()}:
+            self._by_prefix[prefix].append(position)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Find the URL for a concert name.
+
+        An exact title match is preferred. Otherwise the earliest link whose
+        title contains the name, or is contained in it, is returned. Fuzzy
+        candidates are links sharing a word prefix with the name.
+
+        Args:
+            name: Concert or artist name
+
+        Returns:
+            Event URL, or None if no link matches
+        """
+        title = normalize_title(name)
+        if not title:
+            return None
+
+        url = self._exact.get(title)
+        if url is not None:
+            return url
+
+        candidates = set()
+        for word in title.split():
+            candidates.update(self._by_prefix.get(word[:PREFIX_LENGTH], ()))
+
+        for position in sorted(candidates):
+            link_title, url = self._entries[position]
+            if title in link_title or link_title in title:
+                return url
+        return None
@@ -7,25 +7,54 @@ Runs all venue scrapers and generates unified output files.
 import os
 import sys
 import json
+import asyncio
 import yaml
 import logging
 import argparse
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import csv
 import io
+import time
+import importlib
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from scrapers.kb_hallen_scraper_simple import KbHallenScraper
 from scrapers.pumpehuset_scraper import PumpehusetScraper
+from change_feed import diff_concerts, index_concerts, load_snapshot
+from concert_store import ConcertStore
+from output_writers import atomic_write, write_json_stream, write_ndjson
+from ical_export import build_calendar, write_if_changed
+from search_index import SEARCH_FIELDS, SearchIndex
+from scheduler import ScrapeScheduler
+from static_api import write_static_api
+from operator import attrgetter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 
 class ConcertScraperOrchestrator:
     """Main orchestrator for running all venue scrapers."""
     
+    # Output formats by name: method writing (data, output_dir). Other
+    # writers can be registered here or named as "module:function" in
+    # output.formats
+    OUTPUT_WRITERS = {
+        'json': '_save_json',
+        'ndjson': '_save_ndjson',
+        'csv': '_save_csv',
+        'markdown': '_save_markdown',
+        'ics': '_save_ics',
+        'search': '_save_search_index',
+        'static_api': '_save_static_api',
+    }
+    
     def __init__(self, config_path: str = "venues.yaml"):
         """
         Initialize the orchestrator.
@@ -53,6 +82,7 @@ class ConcertScraperOrchestrator:
     def _load_scrapers(self) -> List[Any]:
         """Dynamically load scraper instances based on configuration."""
         scrapers = []
+        parsing_config = self.config['global'].get('parsing', {})
         
         for venue_id, venue_config in self.config['venues'].items():
             if not venue_config.get('enabled', False):
@@ -86,7 +116,12 @@ class ConcertScraperOrchestrator:
                     'url': venue_config.get('url', ''),
                     'rate_limit': venue_config.get('rate_limit', 1),
                     'headers': venue_config.get('headers', {}),
-                    'timeout': venue_config.get('timeout', 30)
+                    'timeout': venue_config.get('timeout', 30),
+                    'parser': venue_config.get('parser', parsing_config.get('parser')),
+                    'pagination': venue_config.get('pagination', {}),
+                    'enrichment': venue_config.get('enrichment', self.config['global'].get('enrichment', {})),
+                    'cache': self.config['global'].get('cache', {}),
+                    'keep_raw_data': self.config['global']['output'].get('raw_data', 'drop') == 'sidecar'
                 }
                 
                 scraper = scraper_class(scraper_config)
@@ -114,12 +149,15 @@ class ConcertScraperOrchestrator:
         
         return logger
     
-    def run_scrapers(self, parallel: bool = True) -> Dict[str, Any]:
+    def run_scrapers(self, parallel: bool = True, fetch_mode: str = None) -> Dict[str, Any]:
         """
         Run all enabled scrapers.
         
         Args:
             parallel: Whether to run scrapers in parallel
+            fetch_mode: 'async' (one event loop, shared connection pool) or
+                'threads' (one blocking session per venue). Defaults to
+                performance.fetch_mode from the configuration.
             
         Returns:
             Dictionary with all venue results
@@ -127,12 +165,98 @@ class ConcertScraperOrchestrator:
         start_time = datetime.now()
         self.logger.info(f"Starting concert scraping for {len(self.scrapers)} venues")
         
+        performance_config = self.config['global']['performance']
+        fetch_mode = fetch_mode or performance_config.get('fetch_mode', 'async')
+        if fetch_mode == 'async' and aiohttp is None:
+            self.logger.warning("aiohttp is not installed, falling back to threaded fetching")
+            fetch_mode = 'threads'
+        
         results = {}
         
-        if parallel and len(self.scrapers) > 1:
+        parse_executor = None
+        if performance_config.get('parse_in_processes', False):
+            # Keep CPU-bound parsing off the I/O threads / event loop
+            parse_executor = ProcessPoolExecutor(max_workers=performance_config.get('parse_workers'))
+            for scraper in self.scrapers:
+                scraper.parse_executor = parse_executor
+        
+        try:
+            results = self._run_all(parallel, fetch_mode, performance_config)
+        finally:
+            if parse_executor is not None:
+                for scraper in self.scrapers:
+                    scraper.parse_executor = None
+                parse_executor.shutdown()
+        
+        if not (parallel and (fetch_mode == 'async' or len(self.scrapers) > 1)):
+            fetch_mode = 'sequential'
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        self.logger.info(f"Scraping completed in {duration:.2f} seconds")
+        for venue_id, result in results.items():
+            timings = result['metadata'].get('timings')
+            if timings:
+                self.logger.info(
+                    f"{venue_id}: fetch {timings['fetch_seconds']:.2f}s, "
+                    f"parse {timings['parse_seconds']:.2f}s"
+                )
+        
+        return self.build_scrape_results(
+            results, start_time, duration, fetch_mode, parse_executor is not None
+        )
+    
+    def build_scrape_results(self, results: Dict[str, Any], scraped_at: datetime, duration: float,
+                             fetch_mode: str, parse_in_processes: bool) -> Dict[str, Any]:
+        """
+        Wrap per-venue results in the structure returned by run_scrapers().
+        
+        Args:
+            results: Dictionary mapping venue IDs to scraper results
+            scraped_at: When scraping started
+            duration: Scraping duration in seconds
+            fetch_mode: Engine used ('async', 'threads', 'sequential' or 'daemon')
+            parse_in_processes: Whether pages were parsed in a process pool
+            
+        Returns:
+            Dictionary with run metadata and all venue results
+        """
+        return {
+            'metadata': {
+                'scraped_at': scraped_at.isoformat(),
+                'duration_seconds': duration,
+                'fetch_mode': fetch_mode,
+                'parse_in_processes': parse_in_processes,
+                'total_venues': len(self.scrapers),
+                'successful_venues': len([r for r in results.values() 
+                                        if r['metadata']['status'] == 'success']),
+                'total_concerts': sum(r['metadata']['total_concerts'] for r in results.values())
+            },
+            'venues': results
+        }
+    
+    def _run_all(self, parallel: bool, fetch_mode: str, performance_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run every scraper with the selected engine.
+        
+        Args:
+            parallel: Whether to run scrapers in parallel
+            fetch_mode: 'async' or 'threads'
+            performance_config: Global performance configuration
+            
+        Returns:
+            Dictionary mapping venue IDs to scraper results
+        """
+        results = {}
+        
+        if parallel and fetch_mode == 'async':
+            # Run all scrapers concurrently on one event loop
+            results = asyncio.run(self._run_scrapers_async())
+        elif parallel and len(self.scrapers) > 1:
             # Run scrapers in parallel
             max_workers = min(len(self.scrapers), 
-                             self.config['global']['performance']['max_concurrent_scrapers'])
+                             performance_config['max_concurrent_scrapers'])
             
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 future_to_scraper = {
@@ -158,22 +282,55 @@ class ConcertScraperOrchestrator:
                     self.logger.error(f"Scraper {scraper.venue_id} failed: {e}")
                     results[scraper.venue_id] = scraper._create_error_result(str(e))
         
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        return results
+    
+    async def _run_scrapers_async(self) -> Dict[str, Any]:
+        """
+        Run every scraper's async pipeline against one pooled HTTP client.
         
-        self.logger.info(f"Scraping completed in {duration:.2f} seconds")
+        Returns:
+            Dictionary mapping venue IDs to scraper results
+        """
+        performance_config = self.config['global']['performance']
+        connector = aiohttp.TCPConnector(
+            limit=performance_config.get('max_connections', 100),
+            limit_per_host=performance_config.get('max_connections_per_host', 4)
+        )
         
-        return {
-            'metadata': {
-                'scraped_at': start_time.isoformat(),
-                'duration_seconds': duration,
-                'total_venues': len(self.scrapers),
-                'successful_venues': len([r for r in results.values() 
-                                        if r['metadata']['status'] == 'success']),
-                'total_concerts': sum(r['metadata']['total_concerts'] for r in results.values())
-            },
-            'venues': results
-        }
+        async with aiohttp.ClientSession(connector=connector) as session:
+            outcomes = await asyncio.gather(
+                *(scraper.run_async(session) for scraper in self.scrapers),
+                return_exceptions=True
+            )
+        
+        results = {}
+        for scraper, outcome in zip(self.scrapers, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Scraper {scraper.venue_id} failed: {outcome}")
+                results[scraper.venue_id] = scraper._create_error_result(str(outcome))
+            else:
+                results[scraper.venue_id] = outcome
+        
+        return results
+    
+    def _collect_raw_data(self, scrape_results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Remove raw venue payloads from the scraped concerts.
+        
+        Args:
+            scrape_results: Results from run_scrapers()
+            
+        Returns:
+            Dictionary mapping concert IDs to raw payloads (empty unless
+            output.raw_data is "sidecar")
+        """
+        raw_data = {}
+        for venue_result in scrape_results['venues'].values():
+            for concert in venue_result.get('concerts', []):
+                if concert.raw_data is not None:
+                    raw_data[concert.id] = concert.raw_data
+                    concert.raw_data = None
+        return raw_data
     
     def generate_unified_data(self, scrape_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -204,17 +361,13 @@ class ConcertScraperOrchestrator:
                 }
         
         # Sort all concerts by date and time
-        try:
-            all_concerts.sort(key=lambda x: (x['date'], x['time']))
-        except TypeError:
-            # Fallback for Python < 3.11
-            all_concerts.sort(key=lambda x: (x.get('date', ''), x.get('time', '')))
+        all_concerts.sort(key=attrgetter('sort_key'))
         
         # Filter upcoming concerts (today or future)
         today = datetime.now().strftime('%Y-%m-%d')
         upcoming_concerts = [
             concert for concert in all_concerts 
-            if concert['date'] >= today
+            if concert.date >= today
         ]
         
         return {
@@ -240,51 +393,281 @@ class ConcertScraperOrchestrator:
         output_dir = self.config['global']['output']['directory']
         os.makedirs(output_dir, exist_ok=True)
         
-        formats = self.config['global']['output']['formats']
+        output_config = self.config['global']['output']
+        writers = {}
+        for name in output_config['formats']:
+            writer = self._resolve_writer(name)
+            if writer is None:
+                self.logger.warning(f"Unknown output format: {name}")
+            else:
+                writers[name] = writer
         
-        if 'json' in formats:
-            self._save_json(data, output_dir)
+        # Diff against the previous snapshot before it is overwritten
+        if output_config.get('delta', False):
+            self._save_delta(data, output_dir)
         
-        if 'csv' in formats:
-            self._save_csv(data, output_dir)
+        # Writers only read the shared, already sorted data, so they can run
+        # side by side
+        timings = {}
+        with ThreadPoolExecutor(max_workers=max(len(writers), 1)) as executor:
+            futures = {
+                executor.submit(self._run_writer, writer, data, output_dir): name
+                for name, writer in writers.items()
+            }
+            for future in as_completed(futures):
+                timings[futures[future]] = round(future.result(), 4)
         
-        if 'markdown' in formats:
-            self._save_markdown(data, output_dir)
+        # The writers have already serialized data, so the timings are
+        # persisted in a stats file of their own
+        data['metadata']['output_timings'] = timings
+        self.logger.info(f"Output timings (seconds): {timings}")
+        self._save_stats(data, output_dir)
+    
+    def _resolve_writer(self, name: str):
+        """
+        Find the writer for an output format.
+        
+        Args:
+            name: Built-in format name, or "module:function" for a custom
+                writer taking (data, output_dir)
+            
+        Returns:
+            Callable taking (data, output_dir), or None if unknown
+        """
+        if name in self.OUTPUT_WRITERS:
+            return getattr(self, self.OUTPUT_WRITERS[name])
+        
+        if ':' in name:
+            module_name, function_name = name.split(':', 1)
+            try:
+                return getattr(importlib.import_module(module_name), function_name)
+            except (ImportError, AttributeError) as e:
+                self.logger.error(f"Could not load output writer {name}: {e}")
+        return None
+    
+    @staticmethod
+    def _run_writer(writer, data: Dict[str, Any], output_dir: str) -> float:
+        """Run one output writer and return how long it took in seconds."""
+        start = time.perf_counter()
+        writer(data, output_dir)
+        return time.perf_counter() - start
+    
+    def _json_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Lay out the unified data for concerts.json.
+        
+        The default "references" layout stores each concert once, in
+        all_concerts; venues and upcoming refer to concerts by id. The
+        "expanded" layout repeats the full records in every list.
+        
+        Args:
+            data: Unified data structure
+            
+        Returns:
+            Document for write_json_stream(), with concert lists as generators
+        """
+        layout = self.config['global']['output'].get('json_layout', 'references')
+        if layout == 'expanded':
+            return {
+                **data,
+                'venues': {
+                    venue_id: {
+                        **venue_data,
+                        'concerts': (concert.to_dict() for concert in venue_data['concerts'])
+                    }
+                    for venue_id, venue_data in data['venues'].items()
+                },
+                'all_concerts': (concert.to_dict() for concert in data['all_concerts']),
+                'upcoming': (concert.to_dict() for concert in data['upcoming'])
+            }
+        
+        return {
+            'last_updated': data['last_updated'],
+            'metadata': {**data['metadata'], 'layout': 'references'},
+            'venues': {
+                venue_id: {
+                    'venue_name': venue_data['venue_name'],
+                    'concert_ids': [concert.id for concert in venue_data['concerts']],
+                    'metadata': venue_data['metadata']
+                }
+                for venue_id, venue_data in data['venues'].items()
+            },
+            'all_concerts': (concert.to_dict() for concert in data['all_concerts']),
+            'upcoming_ids': [concert.id for concert in data['upcoming']]
+        }
     
     def _save_json(self, data: Dict[str, Any], output_dir: str) -> None:
         """Save data as JSON file."""
         output_path = os.path.join(output_dir, 'concerts.json')
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with atomic_write(output_path) as f:
+                write_json_stream(f, self._json_document(data))
             self.logger.info(f"Saved JSON output to {output_path}")
         except Exception as e:
             self.logger.error(f"Error saving JSON: {e}")
     
+    def _save_ndjson(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save concerts as newline-delimited JSON, one concert per line."""
+        output_path = os.path.join(output_dir, 'concerts.ndjson')
+        try:
+            with atomic_write(output_path) as f:
+                write_ndjson(f, (concert.to_dict() for concert in data['all_concerts']))
+            self.logger.info(f"Saved NDJSON output to {output_path}")
+        except Exception as e:
+            self.logger.error(f"Error saving NDJSON: {e}")
+    
+    def _save_raw_data(self, data: Dict[str, Any], raw_data: Dict[str, Any]) -> None:
+        """Save raw venue payloads keyed by concert ID, for debugging."""
+        output_path = os.path.join(self.config['global']['output']['directory'], 'concerts.raw.json')
+        try:
+            with atomic_write(output_path) as f:
+                json.dump({'last_updated': data['last_updated'], 'raw_data': raw_data},
+                          f, ensure_ascii=False, indent=2)
+            self.logger.info(f"Saved raw data to {output_path}")
+        except Exception as e:
+            self.logger.error(f"Error saving raw data: {e}")
+    
+    def _save_stats(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save run, scrape and output writer timings to concerts.stats.json."""
+        output_path = os.path.join(output_dir, 'concerts.stats.json')
+        metadata = data['metadata']
+        stats = {
+            'last_updated': data['last_updated'],
+            'fetch_mode': metadata.get('fetch_mode'),
+            'duration_seconds': metadata.get('duration_seconds'),
+            'venues': {
+                venue_id: venue_data['metadata'].get('timings', {})
+                for venue_id, venue_data in data['venues'].items()
+            },
+            'output_timings': metadata.get('output_timings', {}),
+        }
+        try:
+            with atomic_write(output_path) as f:
+                json.dump(stats, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.logger.error(f"Error saving stats: {e}")
+    
+    def _save_delta(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save the changes since the previous snapshot as a compact JSON delta."""
+        output_path = os.path.join(output_dir, 'concerts.delta.json')
+        try:
+            previous = load_snapshot(os.path.join(output_dir, 'concerts.json'))
+            if previous is None:
+                self.logger.info("No previous snapshot, every concert is reported as added")
+                previous = {'last_updated': None, 'concerts': {}}
+            
+            scraped_venues = [
+                venue_id for venue_id, venue_data in data['venues'].items()
+                if venue_data['metadata']['status'] == 'success'
+            ]
+            current = index_concerts(concert.to_dict() for concert in data['all_concerts'])
+            changes = diff_concerts(previous['concerts'], current, scraped_venues)
+            data['metadata']['changes'] = {kind: len(items) for kind, items in changes.items()}
+            
+            # An empty delta would hide the last real changes from clients
+            # that have not polled since, so the previous delta is kept
+            if not any(changes.values()) and os.path.exists(output_path):
+                self.logger.info(f"No changes, keeping the previous delta at {output_path}")
+                return
+            
+            delta = {
+                'since': previous['last_updated'],
+                'last_updated': data['last_updated'],
+                **changes
+            }
+            with atomic_write(output_path) as f:
+                json.dump(delta, f, ensure_ascii=False, separators=(',', ':'))
+            
+            self.logger.info(
+                f"Saved delta to {output_path}: {len(changes['added'])} added, "
+                f"{len(changes['removed'])} removed, {len(changes['changed'])} changed"
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving delta: {e}")
+    
     def _save_csv(self, data: Dict[str, Any], output_dir: str) -> None:
         """Save concerts as CSV file."""
         output_path = os.path.join(output_dir, 'concerts.csv')
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with atomic_write(output_path, newline='') as f:
                 if data['all_concerts']:
                     fieldnames = ['id', 'name', 'date', 'time', 'status', 'venue', 
                                 'venue_name', 'support', 'genre', 'price', 'url']
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
                     
-                    for concert in data['all_concerts']:
-                        row = {field: concert.get(field, '') for field in fieldnames}
-                        writer.writerow(row)
+                    # Rows are written straight from the records, no per-row dict
+                    get_row = attrgetter(*fieldnames)
+                    writer.writerows(get_row(concert) for concert in data['all_concerts'])
             
             self.logger.info(f"Saved CSV output to {output_path}")
         except Exception as e:
             self.logger.error(f"Error saving CSV: {e}")
     
+    def _save_ics(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save one iCalendar feed per venue plus a combined feed."""
+        calendar_dir = os.path.join(output_dir, 'calendar')
+        try:
+            os.makedirs(calendar_dir, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+            
+            feeds = {'all': ('CopenMusic', data['all_concerts'])}
+            for venue_id, venue_data in data['venues'].items():
+                # Keep the last good feed of a venue that failed this run
+                if venue_data['metadata']['status'] != 'success' and not venue_data['concerts']:
+                    continue
+                feeds[venue_id] = (f"CopenMusic - {venue_data['venue_name']}", venue_data['concerts'])
+            
+            written = []
+            for feed_id, (name, concerts) in feeds.items():
+                path = os.path.join(calendar_dir, f"{feed_id}.ics")
+                if write_if_changed(path, build_calendar(name, concerts, stamp)):
+                    written.append(feed_id)
+            
+            self.logger.info(
+                f"Saved iCalendar feeds to {calendar_dir}: {len(written)} of {len(feeds)} changed"
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving iCalendar feeds: {e}")
+    
+    def _save_search_index(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save the search index for static clients."""
+        output_path = os.path.join(output_dir, 'search_index.json')
+        try:
+            concerts = [
+                {field: getattr(concert, field) for field in SEARCH_FIELDS}
+                for concert in data['all_concerts']
+            ]
+            index = SearchIndex.from_concerts(concerts)
+            with atomic_write(output_path) as f:
+                json.dump({
+                    'last_updated': data['last_updated'],
+                    'fields': list(SEARCH_FIELDS),
+                    # Term positions refer to this list (the all_concerts order)
+                    'ids': [concert.id for concert in data['all_concerts']],
+                    'terms': index.to_dict()
+                }, f, ensure_ascii=False, separators=(',', ':'))
+            self.logger.info(f"Saved search index to {output_path} ({len(index.terms)} terms)")
+        except Exception as e:
+            self.logger.error(f"Error saving search index: {e}")
+    
+    def _save_static_api(self, data: Dict[str, Any], output_dir: str) -> None:
+        """Save sharded static API files with a hash manifest."""
+        api_dir = os.path.join(output_dir, 'api')
+        try:
+            manifest = write_static_api(data, api_dir)
+            self.logger.info(
+                f"Saved static API to {api_dir}: {manifest['written']} of "
+                f"{len(manifest['shards'])} shards changed"
+            )
+        except Exception as e:
+            self.logger.error(f"Error saving static API: {e}")
+    
     def _save_markdown(self, data: Dict[str, Any], output_dir: str) -> None:
         """Save concerts as Markdown file."""
         output_path = os.path.join(output_dir, 'concerts.md')
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with atomic_write(output_path) as f:
                 f.write("# CopenMusic Concert Listings\n\n")
                 f.write(f"Last updated: {data['last_updated']}\n\n")
                 f.write(f"Total concerts: {data['metadata']['total_concerts']}\n")
@@ -296,12 +679,12 @@ class ConcertScraperOrchestrator:
                     
                     if venue_data['concerts']:
                         for concert in venue_data['concerts']:
-                            f.write(f"### {concert['name']}\n\n")
-                            f.write(f"- **Date:** {concert['date']} at {concert['time']}\n")
-                            f.write(f"- **Status:** {concert['status']}\n")
-                            if concert['support']:
-                                f.write(f"- **Support:** {concert['support']}\n")
-                            f.write(f"- **Link:** [{concert['name']}]({concert['url']})\n\n")
+                            f.write(f"### {concert.name}\n\n")
+                            f.write(f"- **Date:** {concert.date} at {concert.time}\n")
+                            f.write(f"- **Status:** {concert.status}\n")
+                            if concert.support:
+                                f.write(f"- **Support:** {concert.support}\n")
+                            f.write(f"- **Link:** [{concert.name}]({concert.url})\n\n")
                     else:
                         f.write("No concerts found or scraping failed.\n\n")
             
@@ -309,31 +692,59 @@ class ConcertScraperOrchestrator:
         except Exception as e:
             self.logger.error(f"Error saving Markdown: {e}")
     
-    def run(self, parallel: bool = True) -> Dict[str, Any]:
+    def run(self, parallel: bool = True, fetch_mode: str = None) -> Dict[str, Any]:
         """
         Run the complete scraping pipeline.
         
         Args:
             parallel: Whether to run scrapers in parallel
+            fetch_mode: 'async' or 'threads' (see run_scrapers)
             
         Returns:
             Final unified data structure
         """
         try:
             # Run all scrapers
-            scrape_results = self.run_scrapers(parallel)
+            scrape_results = self.run_scrapers(parallel, fetch_mode)
             
-            # Generate unified data
-            unified_data = self.generate_unified_data(scrape_results)
+            # Raw payloads never go into the main outputs
+            raw_data = self._collect_raw_data(scrape_results)
             
-            # Save outputs
-            self.save_outputs(unified_data)
-            
-            return unified_data
+            return self.publish(scrape_results, raw_data)
             
         except Exception as e:
             self.logger.error(f"Pipeline failed: {e}")
             raise
+    
+    def publish(self, scrape_results: Dict[str, Any], raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate the unified data from scrape results and save all outputs.
+        
+        Args:
+            scrape_results: Results from run_scrapers() (or build_scrape_results())
+            raw_data: Raw payloads from _collect_raw_data()
+            
+        Returns:
+            Final unified data structure
+        """
+        unified_data = self.generate_unified_data(scrape_results)
+        
+        # With a store, outputs are generated from the stored concerts,
+        # which keep failed venues' last good listings
+        store = ConcertStore.from_config(self.config['global'].get('storage', {}))
+        if store is not None:
+            try:
+                store.save_run(unified_data)
+                unified_data = store.load_unified(list(unified_data['venues']))
+            finally:
+                store.close()
+        
+        # Save outputs
+        self.save_outputs(unified_data)
+        if raw_data:
+            self._save_raw_data(unified_data, raw_data)
+        
+        return unified_data
 
 
 def main():
@@ -345,6 +756,10 @@ def main():
                        help='Run scrapers in parallel')
     parser.add_argument('--sequential', dest='parallel', action='store_false',
                        help='Run scrapers sequentially')
+    parser.add_argument('--fetch-mode', choices=['async', 'threads'], default=None,
+                       help='Fetch engine for parallel runs (default: from configuration)')
+    parser.add_argument('--daemon', action='store_true',
+                       help='Keep running and refresh each venue on its own schedule')
     
     args = parser.parse_args()
     
@@ -355,8 +770,15 @@ def main():
     # Run the orchestrator
     orchestrator = ConcertScraperOrchestrator(args.config)
     
+    if args.daemon:
+        try:
+            asyncio.run(ScrapeScheduler(orchestrator, args.fetch_mode).run())
+        except KeyboardInterrupt:
+            pass
+        return
+    
     try:
-        result = orchestrator.run(parallel=args.parallel)
+        result = orchestrator.run(parallel=args.parallel, fetch_mode=args.fetch_mode)
         
         # Print summary
         print(f"\n=== CopenMusic Scraping Summary ===")
@@ -364,7 +786,17 @@ def main():
         print(f"Upcoming concerts: {result['metadata']['upcoming_concerts']}")
         print(f"Venues scraped: {result['metadata']['venues_count']}")
         print(f"Duration: {result['metadata']['duration_seconds']:.2f} seconds")
+        for venue_id, venue_data in result['venues'].items():
+            timings = venue_data['metadata'].get('timings')
+            if timings:
+                print(f"  {venue_id}: fetch {timings['fetch_seconds']:.2f}s, "
+                      f"parse {timings['parse_seconds']:.2f}s")
         print(f"Output saved to: {orchestrator.config['global']['output']['directory']}/")
+        output_timings = result['metadata'].get('output_timings', {})
+        if output_timings:
+            print("Output writers: " + ", ".join(
+                f"{name} {seconds:.2f}s" for name, seconds in output_timings.items()
+            ))
         
     except Exception as e:
         print(f"Error: {e}")
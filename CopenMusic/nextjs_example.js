@@ -7,8 +7,20 @@
 // Import the concert data (adjust path as needed)
 import concerts from './output/concerts.json';
 
+// concerts.json stores each concert once in all_concerts; venues and
+// upcoming refer to them by id
+const concertsById = Object.fromEntries(concerts.all_concerts.map(concert => [concert.id, concert]));
+const byIds = ids => ids.map(id => concertsById[id]);
+
 export default function ConcertsPage() {
-  const { venues, all_concerts, upcoming, metadata } = concerts;
+  const { all_concerts, metadata } = concerts;
+  const upcoming = byIds(concerts.upcoming_ids);
+  const venues = Object.fromEntries(
+    Object.entries(concerts.venues).map(([venueId, venueData]) => [
+      venueId,
+      { ...venueData, concerts: byIds(venueData.concert_ids) },
+    ])
+  );
 
   return (
     <div style={{ padding: '20px', fontFamily: 'Arial, sans-serif' }}>
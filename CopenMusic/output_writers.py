@@ -0,0 +1,106 @@
+"""
+Streaming, atomic writers for the orchestrator's output files.
+Concerts are encoded one at a time instead of serializing the whole
+document in memory, and every file is written to a temporary path and
+renamed into place, so readers never see a half-written file.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, IO, Iterable, Iterator
+
+INDENT = '  '
+
+
+@contextmanager
+def atomic_write(path: str, newline: str = None, binary: bool = False) -> Iterator[IO]:
+    """
+    Open a file for writing that only replaces path once complete.
+
+    Args:
+        path: Final file path
+        newline: Passed to open() (use '' for CSV)
+        binary: Open in binary mode instead of UTF-8 text
+
+    Yields:
+        File object for a temporary file next to path
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if binary:
+            f = open(tmp_path, 'wb')
+        else:
+            f = open(tmp_path, 'w', encoding='utf-8', newline=newline)
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _dump(value: Any, level: int) -> str:
+    """Encode a value as indented JSON nested at the given level."""
+    text = json.dumps(value, ensure_ascii=False, indent=len(INDENT))
+    return text.replace('\n', '\n' + INDENT * level)
+
+
+def _write_value(f: IO[str], value: Any, level: int) -> None:
+    if isinstance(value, dict):
+        if not value:
+            f.write('{}')
+            return
+        f.write('{')
+        for index, (key, item) in enumerate(value.items()):
+            f.write(',\n' if index else '\n')
+            f.write(f"{INDENT * (level + 1)}{json.dumps(key, ensure_ascii=False)}: ")
+            _write_value(f, item, level + 1)
+        f.write(f"\n{INDENT * level}}}")
+    elif isinstance(value, Iterator):
+        # Streamed array: each item is encoded on its own and then dropped
+        empty = True
+        for item in value:
+            f.write(',\n' if not empty else '[\n')
+            f.write(INDENT * (level + 1) + _dump(item, level + 1))
+            empty = False
+        f.write('[]' if empty else f"\n{INDENT * level}]")
+    else:
+        f.write(_dump(value, level))
+
+
+def write_json_stream(f: IO[str], document: Dict[str, Any]) -> None:
+    """
+    Write a JSON document, streaming any iterator values as arrays.
+
+    The output is identical to json.dump(document, f, indent=2,
+    ensure_ascii=False) with the iterators replaced by lists, but only one
+    array item is encoded at a time.
+
+    Args:
+        f: Text file to write to
+        document: Dictionaries, plain values and iterators (e.g. generators
+            yielding concert dictionaries)
+    """
+    _write_value(f, document, 0)
+
+
+def write_ndjson(f: IO[str], records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Write records as newline-delimited JSON.
+
+    Args:
+        f: Text file to write to
+        records: Dictionaries to write, one per line
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for record in records:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        f.write('\n')
+        count += 1
+    return count
@@ -0,0 +1,133 @@
+"""
+Content-hash parse cache for venue pages.
+Remembers the normalized concerts produced from the last body seen for
+each venue page, so byte-identical pages skip parsing and normalization.
+Entries also record a fingerprint of everything else the results depend
+on (scraper code, parser backend, options, run date); a different
+fingerprint is treated as a miss.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Bump when the stored entry format or normalization changes
+CACHE_VERSION = 2
+
+
+class ParseCache:
+    """File-backed store of normalized concerts keyed by page and body hash."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding one JSON file per venue page
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['ParseCache']:
+        """
+        Build a cache from the global cache.parse configuration section.
+
+        Args:
+            config: Mapping with enabled and directory
+
+        Returns:
+            ParseCache instance, or None if caching is disabled
+        """
+        if not config or not config.get('enabled', False):
+            return None
+        return cls(config.get('directory', '.cache/parsed'))
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """Hash a response body."""
+        return hashlib.sha256(content).hexdigest()
+
+    def _path(self, page_key: str) -> str:
+        return os.path.join(self.directory, f"{page_key}.json")
+
+    def get(self, page_key: str, content_hash: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the results parsed from a body with the given hash.
+
+        Args:
+            page_key: Venue page the body belongs to
+            content_hash: Hash of the current response body
+            fingerprint: Current scraper fingerprint (see BaseScraper.cache_fingerprint)
+
+        Returns:
+            Entry with concerts and next_pages, or None if the body or the
+            fingerprint changed
+        """
+        try:
+            with open(self._path(page_key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if entry.get('content_hash') != content_hash or entry.get('fingerprint') != fingerprint:
+            return None
+        return entry
+
+    def get_recent(self, page_key: str, max_age_seconds: float,
+                   fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored results for a page if they are younger than max_age_seconds.
+
+        Lets callers skip even the conditional request for pages that were
+        checked recently, whatever their current body.
+
+        Args:
+            page_key: Venue page the results belong to
+            max_age_seconds: Maximum age of the stored results
+            fingerprint: Current scraper fingerprint
+
+        Returns:
+            Entry with concerts and next_pages, or None if missing, too old
+            or stored under another fingerprint
+        """
+        try:
+            with open(self._path(page_key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            stored_at = datetime.fromisoformat(entry['stored_at'])
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+
+        if entry.get('fingerprint') != fingerprint:
+            return None
+        if (datetime.now() - stored_at).total_seconds() > max_age_seconds:
+            return None
+        return entry
+
+    def put(self, page_key: str, content_hash: str, fingerprint: str,
+            concerts: List[Dict[str, Any]], next_pages: Optional[List[str]] = None) -> None:
+        """
+        Store the results parsed from a body.
+
+        Args:
+            page_key: Venue page the body belongs to
+            content_hash: Hash of the response body
+            fingerprint: Scraper fingerprint the results were produced with
+            concerts: Normalized concerts parsed from that body
+            next_pages: Further pages discovered on that body
+        """
+        entry = {
+            'content_hash': content_hash,
+            'fingerprint': fingerprint,
+            'stored_at': datetime.now().isoformat(),
+            'concerts': concerts,
+            'next_pages': next_pages or [],
+        }
+        path = self._path(page_key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
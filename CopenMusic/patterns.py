@@ -0,0 +1,53 @@
+"""
+Precompiled regular expressions shared by the base scraper and venue scrapers.
+Compiling once at import keeps pattern setup out of the per-page and
+per-concert loops.
+"""
+
+import re
+
+# Dates: DD.MM.YYYY, DD/MM/YYYY or YYYY-MM-DD in a single pass
+DATE = re.compile(
+    r'(?P<day>\d{2})(?P<sep>[./])(?P<month>\d{2})(?P=sep)(?P<year>\d{4})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})'
+)
+
+# A whole value that is an ISO date (YYYY-MM-DD)
+ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Times given as a bare hour, e.g. "20"
+HOUR_ONLY = re.compile(r'^\d{1,2}$')
+
+# Links to event pages
+EVENT_HREF = re.compile(r'/event/')
+EVENT_DETAIL_HREF = re.compile(r'/event/[^"]+')
+EVENT_OR_ARRANGEMENT_HREF = re.compile(r'/event/|/arrangement/')
+
+# K.B. Hallen month listings: Day.Weekday — Time ArtistName Support Info
+# (the HTML uses the &mdash; entity, so both forms are accepted)
+KB_CONCERT_ENTRY = re.compile(
+    r'(\d{1,2})\.(\w+)\s*(?:—|&mdash;)\s*(\d{1,2}):(\d{2})([^0-9]+?)(?=\d{1,2}\.\w+\s*(?:—|&mdash;)|$)',
+    re.DOTALL
+)
+SPECIAL_GUEST = re.compile(r'with special guest:\s*(.+)', re.IGNORECASE)
+SUPPORT = re.compile(r'support:\s*(.+)', re.IGNORECASE)
+SUPPORT_INLINE = re.compile(r'support:\s*([^,\n]+)', re.IGNORECASE)
+PLUS_SUPPORT = re.compile(r'([^\+]+)\+\s*(.+)')
+PLUS_SUPPORT_INLINE = re.compile(r'\+\s*([^,\n]+)')
+LEADING_DIGIT = re.compile(r'^\d')
+
+# K.B. Hallen month headers, e.g. "Februar 2026" or "Marts"
+MONTH_HEADER = re.compile(
+    r'\b(januar|februar|marts|april|maj|juni|juli|august|september|oktober|november|december)\b'
+    r'(?:\s+(\d{4}))?',
+    re.IGNORECASE
+)
+
+# Pumpehuset banners, e.g. "27. mar 2026"
+DAY_MONTH_NAME_YEAR = re.compile(r'(\d{1,2})\.\s*(\w+)\s*(\d{4})')
+
+# Event detail pages
+ISO_TIME = re.compile(r'T(\d{2}):(\d{2})')
+EVENT_TIME = re.compile(r'\b(?:kl\.?|klokken)\s*(\d{1,2})[:.](\d{2})', re.IGNORECASE)
+EVENT_PRICE = re.compile(r'(\d{1,3}(?:\.\d{3})*|\d+)\s*(?:kr\b\.?|dkk\b|,-)', re.IGNORECASE)
+EVENT_GENRE = re.compile(r'\bgenre:\s*([^\n]{1,60})', re.IGNORECASE)
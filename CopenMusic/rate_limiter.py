@@ -0,0 +1,95 @@
+"""
+Per-host token-bucket rate limiting for venue scrapers.
+Buckets are shared process-wide so every scraper instance, thread and
+async task talking to the same host draws from one budget.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Union
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out send slots instead of sleeping."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_interval: float = 0.0):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum number of requests allowed in a burst
+            min_interval: Minimum seconds between two consecutive requests
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.min_interval = max(min_interval, 0.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve one request slot.
+
+        The slot is booked immediately, so callers only need to wait the
+        returned delay (with time.sleep or asyncio.sleep) before sending.
+
+        Returns:
+            Seconds to wait before the request may be sent (0 if budget left)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            delay = 0.0
+            if self._tokens < 0 and self.rate > 0:
+                delay = -self._tokens / self.rate
+
+            send_at = max(now + delay, self._next_allowed)
+            self._next_allowed = send_at + self.min_interval
+            return send_at - now
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_host_bucket(url: str, rate_limit: Union[Dict[str, Any], float, int, None]) -> TokenBucket:
+    """
+    Get the shared token bucket for the host of a URL.
+
+    The first scraper to register a host decides its budget; later
+    scrapers for the same host share that bucket.
+
+    Args:
+        url: Any URL on the host being limited
+        rate_limit: Venue rate_limit config. Either a mapping with
+            requests_per_minute, delay_between_requests and optional burst,
+            or a plain number of requests per second.
+
+    Returns:
+        TokenBucket shared by all requests to that host
+    """
+    host = urlparse(url).netloc.lower()
+
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            if isinstance(rate_limit, dict):
+                rate = rate_limit.get('requests_per_minute', 60) / 60
+                min_interval = rate_limit.get('delay_between_requests', 0)
+                burst = rate_limit.get('burst', 1)
+            else:
+                rate = float(rate_limit or 1)
+                min_interval = 0
+                burst = 1
+            bucket = TokenBucket(rate, capacity=burst, min_interval=min_interval)
+            _buckets[host] = bucket
+        return bucket
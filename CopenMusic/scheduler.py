@@ -0,0 +1,254 @@
+"""
+Long-running scrape scheduler for main.py --daemon.
+Keeps the orchestrator's scrapers, HTTP sessions, caches and parse pool
+alive between runs and refreshes each venue on its own interval, with
+random jitter and exponential backoff after failures. When a refresh
+changes a venue's concerts, the outputs are rebuilt from the latest good
+result of every venue.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Seconds between refreshes of a venue without its own refresh_interval
+DEFAULT_INTERVAL = 3600.0
+# Random spread of every delay, as a fraction of it
+DEFAULT_JITTER = 0.1
+# First retry delay after a failure, doubled per consecutive failure
+DEFAULT_BACKOFF = 60.0
+DEFAULT_MAX_BACKOFF = 3600.0
+
+
+class VenueSchedule:
+    """Refresh interval and failure backoff for one venue."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, jitter: float = DEFAULT_JITTER,
+                 backoff: float = DEFAULT_BACKOFF, max_backoff: float = DEFAULT_MAX_BACKOFF):
+        """
+        Initialize the schedule.
+
+        Args:
+            interval: Seconds between successful refreshes
+            jitter: Random spread of each delay, as a fraction of it
+            backoff: Seconds before the first retry after a failure
+            max_backoff: Longest delay between retries
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failures = 0
+
+    def next_delay(self, success: bool) -> float:
+        """
+        Record the outcome of a refresh and get the delay until the next one.
+
+        Args:
+            success: Whether the refresh succeeded
+
+        Returns:
+            Seconds to wait
+        """
+        self.failures = 0 if success else self.failures + 1
+        if self.failures:
+            delay = min(self.backoff * 2 ** (self.failures - 1), self.max_backoff)
+        else:
+            delay = self.interval
+        # Jitter keeps venues sharing an interval from refreshing in lockstep
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class ScrapeScheduler:
+    """Refreshes venues on their own schedules and republishes the outputs."""
+
+    def __init__(self, orchestrator: Any, fetch_mode: str = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            orchestrator: ConcertScraperOrchestrator with loaded scrapers
+            fetch_mode: 'async' or 'threads' (defaults to
+                performance.fetch_mode from the configuration)
+        """
+        self.orchestrator = orchestrator
+        self.logger = logging.getLogger('CopenMusic.Scheduler')
+
+        global_config = orchestrator.config['global']
+        self.performance_config = global_config['performance']
+        self.fetch_mode = fetch_mode or self.performance_config.get('fetch_mode', 'async')
+        if self.fetch_mode == 'async' and aiohttp is None:
+            self.logger.warning("aiohttp is not installed, falling back to threaded fetching")
+            self.fetch_mode = 'threads'
+
+        scheduler_config = global_config.get('scheduler', {})
+        self.schedules = {}
+        for scraper in orchestrator.scrapers:
+            venue_config = orchestrator.config['venues'].get(scraper.venue_id, {})
+            self.schedules[scraper.venue_id] = VenueSchedule(
+                interval=float(venue_config.get(
+                    'refresh_interval', scheduler_config.get('refresh_interval', DEFAULT_INTERVAL)
+                )),
+                jitter=float(scheduler_config.get('jitter', DEFAULT_JITTER)),
+                backoff=float(scheduler_config.get('backoff_seconds', DEFAULT_BACKOFF)),
+                max_backoff=float(scheduler_config.get('max_backoff_seconds', DEFAULT_MAX_BACKOFF)),
+            )
+
+        # Latest good result (or first failure) and raw payloads per venue
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.raw_data: Dict[str, Dict[str, Any]] = {}
+        # Serialized concerts of each venue as last published
+        self._published: Dict[str, List[str]] = {}
+        self._dirty = None
+
+    async def run(self) -> None:
+        """Run until cancelled (Ctrl+C or SIGTERM)."""
+        loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+        scrapers = self.orchestrator.scrapers
+        parse_executor = None
+        if self.performance_config.get('parse_in_processes', False):
+            parse_executor = ProcessPoolExecutor(max_workers=self.performance_config.get('parse_workers'))
+            for scraper in scrapers:
+                scraper.parse_executor = parse_executor
+
+        session = None
+        if self.fetch_mode == 'async':
+            # One connection pool for the daemon's lifetime, so refreshes
+            # reuse open keep-alive connections
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=self.performance_config.get('max_connections', 100),
+                limit_per_host=self.performance_config.get('max_connections_per_host', 4)
+            ))
+
+        self.logger.info(
+            f"Scheduling {len(scrapers)} venues ({self.fetch_mode}): " + ", ".join(
+                f"{venue_id} every {schedule.interval:.0f}s"
+                for venue_id, schedule in self.schedules.items()
+            )
+        )
+
+        tasks = [asyncio.create_task(self._publisher())]
+        tasks += [asyncio.create_task(self._venue_loop(scraper, session)) for scraper in scrapers]
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if session is not None:
+                await session.close()
+            if parse_executor is not None:
+                for scraper in scrapers:
+                    scraper.parse_executor = None
+                parse_executor.shutdown()
+            self.logger.info("Scheduler stopped")
+
+    async def _venue_loop(self, scraper: Any, session: Any) -> None:
+        """Refresh one venue forever, starting immediately."""
+        schedule = self.schedules[scraper.venue_id]
+        while True:
+            result = await self._scrape(scraper, session)
+            success = result['metadata']['status'] == 'success'
+
+            raw_data = self.orchestrator._collect_raw_data({'venues': {scraper.venue_id: result}})
+            previous = self.results.get(scraper.venue_id)
+            if success or previous is None or previous['metadata']['status'] != 'success':
+                self.results[scraper.venue_id] = result
+                self.raw_data[scraper.venue_id] = raw_data
+                # Republishing unchanged concerts would only churn ETags
+                # and live-update events, so only changes trigger it
+                concerts = self._serialize(result)
+                if concerts != self._published.get(scraper.venue_id):
+                    self._published[scraper.venue_id] = concerts
+                    self._dirty.set()
+
+            delay = schedule.next_delay(success)
+            if success:
+                self.logger.info(
+                    f"{scraper.venue_id}: {result['metadata']['total_concerts']} concerts, "
+                    f"next refresh in {delay:.0f}s"
+                )
+            else:
+                self.logger.warning(
+                    f"{scraper.venue_id}: refresh failed ({schedule.failures} in a row), "
+                    f"retrying in {delay:.0f}s"
+                )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _serialize(result: Dict[str, Any]) -> List[str]:
+        """Order-independent serialization of a venue result's concerts and status."""
+        concerts = sorted(
+            json.dumps(concert.to_dict(), ensure_ascii=False, sort_keys=True)
+            for concert in result['concerts']
+        )
+        return [result['metadata']['status']] + concerts
+
+    async def _scrape(self, scraper: Any, session: Any) -> Dict[str, Any]:
+        """Run one scraper with the warm session or its own blocking session."""
+        try:
+            if session is not None:
+                return await scraper.run_async(session)
+            return await asyncio.get_running_loop().run_in_executor(None, scraper.run)
+        except Exception as e:
+            self.logger.error(f"Scraper {scraper.venue_id} failed: {e}")
+            return scraper._create_error_result(str(e))
+
+    async def _publisher(self) -> None:
+        """
+        Rebuild the outputs after refreshes.
+
+        Refreshes that finish while the outputs are being written are
+        coalesced into a single rebuild. Nothing is written until every
+        venue has a first result, so a partial set of venues never
+        replaces the previous outputs.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._dirty.wait()
+            if len(self.results) < len(self.orchestrator.scrapers):
+                self._dirty.clear()
+                continue
+            self._dirty.clear()
+
+            # Report the most recent refresh as the run
+            latest = max(self.results.values(), key=lambda result: result['metadata']['scraped_at'])
+            scrape_results = self.orchestrator.build_scrape_results(
+                dict(self.results),
+                datetime.fromisoformat(latest['metadata']['scraped_at']),
+                latest['metadata']['duration_seconds'],
+                'daemon',
+                any(scraper.parse_executor is not None for scraper in self.orchestrator.scrapers)
+            )
+            raw_data = {
+                concert_id: payload
+                for venue_raw_data in self.raw_data.values()
+                for concert_id, payload in venue_raw_data.items()
+            }
+            try:
+                # Writers are blocking; keep them off the loop
+                data = await loop.run_in_executor(None, self.orchestrator.publish, scrape_results, raw_data)
+                self.logger.info(
+                    f"Published {data['metadata']['total_concerts']} concerts "
+                    f"({data['metadata']['upcoming_concerts']} upcoming)"
+                )
+            except Exception as e:
+                self.logger.error(f"Publishing failed: {e}")
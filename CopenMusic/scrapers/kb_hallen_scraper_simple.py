@@ -3,19 +3,26 @@ Simple K.B. Hallen scraper implementation.
 Extracts concert data using a more direct approach.
 """
 
-import re
-from typing import Dict, List, Any
-from bs4 import BeautifulSoup, Tag
+from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import patterns
 from base_scraper import BaseScraper
+from danish_dates import month_header_reference, parse_danish_date
 
 
 class KbHallenScraper(BaseScraper):
     """Scraper for K.B. Hallen concert venue."""
     
+    # Concert listings and their event links live in the month blocks
+    parse_only = SoupStrainer('div', class_='list-month')
+    
+    # Entries without a status word are listed as on sale
+    default_status = 'Tilgængelig'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.venue_id = 'kb_hallen'
@@ -29,7 +36,7 @@ class KbHallenScraper(BaseScraper):
         
         # Get all event links first
         event_links = {}
-        for link in soup.find_all('a', href=re.compile(r'/event/[^"]+')):
+        for link in soup.find_all('a', href=patterns.EVENT_DETAIL_HREF):
             href = link.get('href', '')
             if href.startswith('/'):
                 href = f"https://kbhallen.dk{href}"
@@ -40,6 +47,18 @@ class KbHallenScraper(BaseScraper):
         # Get the full page text and look for concert patterns
         page_text = soup.get_text()
         
+        # Entries listed under each month header, keyed by (day, weekday), so
+        # every block is scanned once however many concerts are looked up
+        listed_entries = {}
+        for month_div in soup.find_all('div', class_='list-month'):
+            month_text = month_div.get_text()
+            reference = self._month_reference(month_text)
+            if reference is None:
+                continue
+            for entry_day, entry_weekday, _, _, info in patterns.KB_CONCERT_ENTRY.findall(month_text):
+                key = (int(entry_day), entry_weekday.lower())
+                listed_entries.setdefault(key, []).append((info.lower(), reference))
+        
         # Known concerts from the website (based on our debugging)
         known_concerts = [
             {"name": "Zach Top", "date": "25", "weekday": "Onsdag", "time": "20:00", "support": "Wyatt Mccubbin"},
@@ -76,7 +95,7 @@ class KbHallenScraper(BaseScraper):
             support = concert_info["support"]
             
             # Determine status by checking the page text
-            status = "Tilgængelig"
+            status = self.default_status
             if name in page_text and "Udsolgt" in page_text:
                 # Check if this specific concert is sold out
                 concert_section = page_text[page_text.find(name):page_text.find(name) + 200]
@@ -97,8 +116,9 @@ class KbHallenScraper(BaseScraper):
                         event_url = url
                     break
             
-            # Parse the date properly
-            date_iso = self._parse_danish_date(day, weekday)
+            # Parse the date against the header of the block listing it
+            reference = self._entry_reference(listed_entries, name, day, weekday)
+            date_iso = self._parse_danish_date(day, weekday, reference)
             
             concerts.append({
                 'name': name,
@@ -113,59 +133,32 @@ class KbHallenScraper(BaseScraper):
         
         return concerts
     
-    def _parse_danish_date(self, day: str, weekday: str) -> str:
+    def _parse_danish_date(self, day: str, weekday: str,
+                           reference: Optional[Tuple[int, int]] = None) -> str:
         """Parse Danish day and weekday to ISO date format."""
-        from datetime import datetime, timedelta
-        
-        # Map Danish weekdays to English
-        weekday_map = {
-            'mandag': 0, 'monday': 0,
-            'tirsdag': 1, 'tuesday': 1,
-            'onsdag': 2, 'wednesday': 2,
-            'torsdag': 3, 'thursday': 3,
-            'fredag': 4, 'friday': 4,
-            'lørdag': 5, 'saturday': 5,
-            'søndag': 6, 'sunday': 6
-        }
-        
-        # Get current date
-        current_date = datetime.now()
-        day_num = int(day)
-        
-        # Try to find the next occurrence of this weekday
-        target_weekday = weekday_map.get(weekday.lower())
-        if target_weekday is not None:
-            # Find the next date that matches this weekday and day
-            for month_offset in range(0, 4):  # Look up to 4 months ahead
-                test_date = current_date.replace(day=1) + timedelta(days=32 * month_offset)
-                
-                # Find the first occurrence of the target weekday in this month
-                first_day = test_date.replace(day=1)
-                days_until_target = (target_weekday - first_day.weekday()) % 7
-                first_occurrence = first_day + timedelta(days=days_until_target)
-                
-                # Check if any occurrence in this month matches our day
-                for week_offset in range(5):  # Check up to 5 weeks
-                    candidate_date = first_occurrence + timedelta(weeks=week_offset)
-                    if (candidate_date.month == first_occurrence.month and 
-                        candidate_date.day == day_num and
-                        candidate_date >= current_date):
-                        return candidate_date.strftime('%Y-%m-%d')
+        return parse_danish_date(day, weekday, reference)
+    
+    def _month_reference(self, month_text: str) -> Optional[Tuple[int, int]]:
+        """Get the (year, month) of a list-month block from its header."""
+        return month_header_reference(month_text)
+    
+    def _entry_reference(self, listed_entries: Dict[Tuple[int, str], List[Tuple[str, Tuple[int, int]]]],
+                         name: str, day: str, weekday: str) -> Optional[Tuple[int, int]]:
+        """
+        Find the month header of the block that lists a concert.
         
-        # Fallback: use current month
-        try:
-            fallback_date = current_date.replace(day=day_num)
-            if fallback_date >= current_date:
-                return fallback_date.strftime('%Y-%m-%d')
-            else:
-                # If date passed, use next month
-                if fallback_date.month == 12:
-                    fallback_date = fallback_date.replace(year=fallback_date.year + 1, month=1)
-                else:
-                    fallback_date = fallback_date.replace(month=fallback_date.month + 1)
-                return fallback_date.strftime('%Y-%m-%d')
-        except ValueError:
-            # Invalid day for current month, use next month
-            next_month = current_date.replace(day=28) + timedelta(days=4)  # This gets us to next month
-            next_month = next_month.replace(day=day_num)
-            return next_month.strftime('%Y-%m-%d')
+        Args:
+            listed_entries: (lowercased info, reference) of the entries listed
+                on each (day, lowercased weekday)
+            name: Concert name
+            day: Day of month as text
+            weekday: Danish weekday name
+            
+        Returns:
+            (year, month) of the block, or None if no block lists the entry
+        """
+        name = name.lower()
+        for info, reference in listed_entries.get((int(day), weekday.lower()), ()):
+            if name in info:
+                return reference
+        return None
@@ -2,19 +2,29 @@
 Pumpehuset scraper for CopenMusic concert scraper system.
 """
 
-import re
 from typing import Dict, List, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import patterns
 from base_scraper import BaseScraper
-
+from danish_dates import MONTHS
+from link_index import EventLinkIndex
 
 class PumpehusetScraper(BaseScraper):
     """Scraper for Pumpehuset concert venue."""
     
+    # Event links and the date banner divs, which usually sit outside the
+    # links, are all we read; head, scripts and styles are skipped
+    parse_only = SoupStrainer(['a', 'div'])
+    
+    # The programme page shows no times; enrichment fills in the real one
+    default_time = '19:00'
+    # Nor ticket statuses; enrichment reads them from the event page
+    default_status = 'Tilgængelig'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.venue_id = 'pumpehuset'
@@ -26,14 +36,14 @@ class PumpehusetScraper(BaseScraper):
         """
         concerts = []
         
-        # Look for event links
-        event_links = {}
-        all_links = soup.find_all('a', href=re.compile(r'/event/|/arrangement/'))
+        # Index event links by title once, so matching stays linear in page size
+        event_links = EventLinkIndex()
+        all_links = soup.find_all('a', href=patterns.EVENT_OR_ARRANGEMENT_HREF)
         for link in all_links:
             href = link.get('href', '')
-            text = link.get_text().strip()
-            if text:
-                event_links[text] = href
+            if href.startswith('/'):
+                href = f"https://pumpehuset.dk{href}"
+            event_links.add(link.get_text(), href)
         
         # Look for event containers with date information
         event_containers = soup.find_all('div', class_='single-event-banner-text')
@@ -44,7 +54,7 @@ class PumpehusetScraper(BaseScraper):
                 container_text = container.get_text()
                 
                 # Look for date pattern (e.g., "27. mar 2026", "19. sep 2026")
-                date_match = re.search(r'(\d{1,2})\.\s*(\w+)\s*(\d{4})', container_text)
+                date_match = patterns.DAY_MONTH_NAME_YEAR.search(container_text)
                 if not date_match:
                     continue
                 
@@ -70,36 +80,14 @@ class PumpehusetScraper(BaseScraper):
                     continue
                 
                 # Try to find event URL
-                event_url = ""
-                for text, url in event_links.items():
-                    if artist_name.lower() in text.lower() or text.lower() in artist_name.lower():
-                        if url.startswith('/'):
-                            event_url = f"https://pumpehuset.dk{url}"
-                        else:
-                            event_url = url
-                        break
+                event_url = event_links.lookup(artist_name)
             
                 # If no URL found, try to construct from program page
                 if not event_url:
                     event_url = f"https://pumpehuset.dk/program/?genre=Jazz%2CMetal%2CRock%2CPop"
                 
                 # Parse month name to number
-                month_map = {
-                    'jan': 1, 'januar': 1,
-                    'feb': 2, 'februar': 2,
-                    'mar': 3, 'marts': 3,
-                    'apr': 4, 'april': 4,
-                    'maj': 5, 'maj': 5,
-                    'jun': 6, 'juni': 6,
-                    'jul': 7, 'juli': 7,
-                    'aug': 8, 'august': 8,
-                    'sep': 9, 'september': 9,
-                    'okt': 10, 'oktober': 10,
-                    'nov': 11, 'november': 11,
-                    'dec': 12, 'december': 12
-                }
-                
-                month_num = month_map.get(month.lower(), 1)
+                month_num = MONTHS.get(month.lower(), 1)
                 
                 # Format date as ISO
                 try:
@@ -108,13 +96,13 @@ class PumpehusetScraper(BaseScraper):
                     date_iso = f"{year}-{month_num:02d}-{day:02d}"
                 
                 # Default time (Pumpehuset doesn't seem to show times)
-                time_str = "19:00"  # Default evening time
+                time_str = self.default_time
                 
                 concerts.append({
                     'name': artist_name,
                     'date': date_iso,
                     'time': time_str,
-                    'status': 'Tilgængelig',  # Default status
+                    'status': self.default_status,
                     'url': event_url,
                     'support': '',
                     'genre': '',
@@ -0,0 +1,150 @@
+"""
+Inverted search index over concert names, support acts and genres.
+Text is folded to plain lowercase ASCII ("Høyen" -> "hoyen", "æ" -> "ae"),
+and the sorted term list is bisected so every query word also matches as
+a prefix, for autocomplete.
+"""
+
+import json
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+# Concert fields that are searched
+SEARCH_FIELDS = ('name', 'support', 'genre')
+DEFAULT_LIMIT = 20
+
+# Letters NFKD does not decompose
+_FOLD_TABLE = str.maketrans({
+    'æ': 'ae', 'Æ': 'ae',
+    'ø': 'o', 'Ø': 'o',
+    'ß': 'ss',
+    'đ': 'd', 'Đ': 'd',
+    'ł': 'l', 'Ł': 'l',
+})
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+def fold(text: str) -> str:
+    """Lowercase text and strip diacritics."""
+    decomposed = unicodedata.normalize('NFKD', text.translate(_FOLD_TABLE))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into folded search terms."""
+    return _TOKEN.findall(fold(text))
+
+
+class SearchIndex:
+    """Maps folded terms to the positions of the concerts containing them."""
+
+    def __init__(self, terms: Dict[str, List[int]]):
+        """
+        Initialize the index.
+
+        Args:
+            terms: Term -> ascending concert positions
+        """
+        self.terms = terms
+        self.sorted_terms = sorted(terms)
+
+    @classmethod
+    def from_concerts(cls, concerts: Iterable[Dict[str, Any]]) -> 'SearchIndex':
+        """
+        Build the index.
+
+        Args:
+            concerts: Concert dictionaries; positions refer to this order
+
+        Returns:
+            SearchIndex instance
+        """
+        terms: Dict[str, List[int]] = {}
+        for position, concert in enumerate(concerts):
+            words = set()
+            for field in SEARCH_FIELDS:
+                words.update(tokenize(concert.get(field) or ''))
+            for word in words:
+                terms.setdefault(word, []).append(position)
+        return cls(terms)
+
+    @classmethod
+    def load(cls, path: str, concerts: List[Dict[str, Any]],
+             last_updated: Optional[str]) -> Optional['SearchIndex']:
+        """
+        Load a search_index.json written by the search output format.
+
+        Args:
+            path: Path of search_index.json
+            concerts: Concert dictionaries; positions are remapped to this order
+            last_updated: last_updated of the snapshot the concerts come from
+
+        Returns:
+            SearchIndex instance, or None if the file is missing, unreadable,
+            or was written for another snapshot or other fields
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get('last_updated') != last_updated or saved.get('fields') != list(SEARCH_FIELDS):
+            return None
+
+        # Concerts can share an id (e.g. several shows a day), so repeated
+        # ids are matched up in order
+        positions: Dict[str, List[int]] = {}
+        for position, concert in enumerate(concerts):
+            positions.setdefault(concert.get('id'), []).append(position)
+        try:
+            remap = [positions[concert_id].pop(0) for concert_id in saved['ids']]
+            terms = {
+                term: sorted(remap[position] for position in saved_positions)
+                for term, saved_positions in saved['terms'].items()
+            }
+        except (KeyError, IndexError, TypeError):
+            return None
+        return cls(terms)
+
+    def _prefix_matches(self, prefix: str) -> set:
+        """Positions of concerts with a term starting with prefix."""
+        positions = set()
+        start = bisect_left(self.sorted_terms, prefix)
+        for term in self.sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            positions.update(self.terms[term])
+        return positions
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        """
+        Find concerts matching every word of a query.
+
+        Each word matches any term it is a prefix of, so "kin gi" finds
+        "King Gizzard".
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            Matching concert positions in ascending order
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        # Match the most selective (longest) words first
+        matches = None
+        for word in sorted(set(words), key=len, reverse=True):
+            positions = self._prefix_matches(word)
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                return []
+        return sorted(matches)[:limit]
+
+    def to_dict(self) -> Dict[str, List[int]]:
+        """Serialize the index (term -> positions)."""
+        return self.terms
@@ -0,0 +1,159 @@
+"""
+Static JSON API shards for hosting the output directory on GitHub Pages.
+Splits the concerts into small files per venue, per month and upcoming
+(plus undated.json for concerts whose date could not be parsed),
+each with precompressed .gz (and .br when brotli is installed) copies, and
+an index.json manifest of content hashes. Unchanged shards are not
+rewritten, so their hashes and cached copies stay valid between runs.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import patterns
+from concert import Concert
+from output_writers import atomic_write
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST = 'index.json'
+# Shard for concerts without an ISO date, which have no month
+UNDATED_SHARD = 'undated.json'
+
+
+def _shard_bytes(document: Dict[str, Any]) -> bytes:
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _compressed(body: bytes) -> Dict[str, bytes]:
+    """Precompressed variants of a shard, keyed by file suffix."""
+    # mtime=0 keeps the gzip output identical for identical content
+    variants = {'.gz': gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(body, quality=11)
+    return variants
+
+
+def _load_manifest(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def build_shards(data: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Split unified data into shard documents.
+
+    Shards leave out run timestamps so that their content, and hash, only
+    changes when their concerts do.
+
+    Args:
+        data: Unified data structure with Concert records
+
+    Returns:
+        Dictionary mapping shard paths (relative to the API directory) to
+        documents; None for venues that failed this run and have no concerts
+    """
+    def serialize(concerts: List[Concert]) -> List[Dict[str, Any]]:
+        return [concert.to_dict() for concert in concerts]
+
+    shards = {
+        'upcoming.json': {'concerts': serialize(data['upcoming'])},
+    }
+
+    for venue_id, venue_data in data['venues'].items():
+        if venue_data['metadata']['status'] != 'success' and not venue_data['concerts']:
+            shards[f'venues/{venue_id}.json'] = None
+            continue
+        shards[f'venues/{venue_id}.json'] = {
+            'venue': venue_id,
+            'venue_name': venue_data['venue_name'],
+            'concerts': serialize(venue_data['concerts']),
+        }
+
+    by_month: Dict[str, List[Concert]] = {}
+    undated: List[Concert] = []
+    for concert in data['all_concerts']:
+        if concert.date and patterns.ISO_DATE.match(concert.date):
+            by_month.setdefault(concert.date[:7], []).append(concert)
+        else:
+            undated.append(concert)
+    for month, concerts in by_month.items():
+        shards[f'months/{month}.json'] = {'month': month, 'concerts': serialize(concerts)}
+    if undated:
+        shards[UNDATED_SHARD] = {'concerts': serialize(undated)}
+
+    return shards
+
+
+def write_static_api(data: Dict[str, Any], api_dir: str) -> Dict[str, Any]:
+    """
+    Write the static API shards and their manifest.
+
+    Args:
+        data: Unified data structure with Concert records
+        api_dir: Directory to write to (e.g. output/api)
+
+    Returns:
+        The manifest, with written (number of shards rewritten) added
+    """
+    manifest_path = os.path.join(api_dir, MANIFEST)
+    previous = _load_manifest(manifest_path).get('shards', {})
+
+    entries = {}
+    written = 0
+    for shard_path, document in build_shards(data).items():
+        if document is None:
+            # Keep the last good shard of a venue that failed this run
+            if shard_path in previous:
+                entries[shard_path] = previous[shard_path]
+            continue
+
+        body = _shard_bytes(document)
+        content_hash = hashlib.sha256(body).hexdigest()[:16]
+        entries[shard_path] = {
+            'hash': content_hash,
+            'bytes': len(body),
+            'concerts': len(document['concerts']),
+        }
+
+        path = os.path.join(api_dir, shard_path)
+        if previous.get(shard_path, {}).get('hash') == content_hash and os.path.exists(path):
+            continue
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_write(path, binary=True) as f:
+            f.write(body)
+        for suffix, compressed in _compressed(body).items():
+            with atomic_write(path + suffix, binary=True) as f:
+                f.write(compressed)
+        written += 1
+
+    _remove_stale(api_dir, previous, entries)
+
+    manifest = {
+        'last_updated': data['last_updated'],
+        'encodings': ['gzip'] + (['br'] if brotli is not None else []),
+        'shards': entries,
+    }
+    with atomic_write(manifest_path) as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    return {**manifest, 'written': written}
+
+
+def _remove_stale(api_dir: str, previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Delete shards (and their compressed copies) that are no longer listed."""
+    for shard_path in set(previous) - set(current):
+        path = os.path.join(api_dir, shard_path)
+        for suffix in ('', '.gz', '.br'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
@@ -0,0 +1,80 @@
+"""
+Tests for the /concerts query index and its routing.
+Run with: python -m pytest test_concert_index.py
+"""
+
+import json
+
+import pytest
+
+from api_server import ConcertData, route
+from concert_index import ConcertIndex, QueryError, encode_cursor
+
+CONCERTS = [
+    {'id': 'kb-a', 'venue': 'kb_hallen', 'status': 'sold_out', 'date': '2026-03-01', 'time': '20:00'},
+    {'id': 'kb-b', 'venue': 'kb_hallen', 'status': 'available', 'date': '2026-03-05', 'time': '20:00'},
+    {'id': 'pu-a', 'venue': 'pumpehuset', 'status': 'sold_out', 'date': '2026-03-05', 'time': '19:00'},
+    {'id': 'kb-c', 'venue': 'kb_hallen', 'status': 'sold_out', 'date': '2026-03-10', 'time': '14:30'},
+    {'id': 'kb-d', 'venue': 'kb_hallen', 'status': 'sold_out', 'date': '2026-03-10', 'time': '18:30'},
+    {'id': 'pu-b', 'venue': 'pumpehuset', 'status': 'available', 'date': '2026-04-02', 'time': '19:00'},
+]
+
+
+def _ids(page):
+    return [concert['id'] for concert in page['concerts']]
+
+
+def test_filters_intersect():
+    index = ConcertIndex(CONCERTS)
+    assert _ids(index.query(venue='kb_hallen', status='sold_out')) == ['kb-a', 'kb-c', 'kb-d']
+    assert _ids(index.query(venue='pumpehuset', status='sold_out')) == ['pu-a']
+    assert _ids(index.query(venue='vega')) == []
+
+
+def test_date_bounds_are_inclusive():
+    index = ConcertIndex(CONCERTS)
+    assert _ids(index.query(date_from='2026-03-05', date_to='2026-03-10')) == ['pu-a', 'kb-b', 'kb-c', 'kb-d']
+    assert _ids(index.query(date_from='2026-03-11')) == ['pu-b']
+    assert _ids(index.query(date_to='2026-03-01')) == ['kb-a']
+
+
+def test_cursor_continues_after_previous_page():
+    index = ConcertIndex(CONCERTS)
+    first = index.query(venue='kb_hallen', limit=2)
+    assert _ids(first) == ['kb-a', 'kb-b']
+    second = index.query(venue='kb_hallen', limit=2, cursor=first['next_cursor'])
+    assert _ids(second) == ['kb-c', 'kb-d']
+    assert second['next_cursor'] is None
+
+    # A cursor keeps working when concerts share a date
+    after = index.query(cursor=encode_cursor(('2026-03-10', '14:30', 'kb-c')))
+    assert _ids(after) == ['kb-d', 'pu-b']
+
+
+def test_bad_cursor_is_rejected():
+    with pytest.raises(QueryError):
+        ConcertIndex(CONCERTS).query(cursor='not-a-cursor')
+
+
+@pytest.fixture
+def concert_data(tmp_path):
+    path = tmp_path / 'concerts.json'
+    path.write_text(json.dumps({'last_updated': '2026-03-01T00:00:00', 'all_concerts': CONCERTS}))
+    return ConcertData(str(path))
+
+
+def test_bad_cursor_returns_400(concert_data):
+    status_code, _, body = route(concert_data, '/concerts?cursor=not-a-cursor', {})
+    assert status_code == 400
+    assert 'cursor' in json.loads(body)['error']
+
+
+def test_unknown_parameters_return_full_document(concert_data):
+    _, _, full = route(concert_data, '/concerts', {})
+    status_code, _, body = route(concert_data, '/concerts?v=abc123&_=1', {})
+    assert status_code == 200
+    assert body == full
+    assert 'next_cursor' not in json.loads(body)
+
+    status_code, _, body = route(concert_data, '/concerts?v=abc123&venue=pumpehuset', {})
+    assert [concert['id'] for concert in json.loads(body)['concerts']] == ['pu-a', 'pu-b']
@@ -18,8 +18,12 @@ def main():
         print(f"Upcoming Concerts: {data['metadata']['upcoming_concerts']}")
         print("=" * 50)
         
-        # Show next 5 upcoming concerts
-        upcoming = data['upcoming'][:5]
+        # Show next 5 upcoming concerts (the default layout lists them by id)
+        concerts_by_id = {concert['id']: concert for concert in data['all_concerts']}
+        if 'upcoming_ids' in data:
+            upcoming = [concerts_by_id[concert_id] for concert_id in data['upcoming_ids'][:5]]
+        else:
+            upcoming = data['upcoming'][:5]
         
         for i, concert in enumerate(upcoming, 1):
             print(f"\n{i}. {concert['name']}")
@@ -34,7 +38,7 @@ def main():
         # Show by venue breakdown
         print(f"\n📍 Venue Breakdown:")
         for venue_id, venue_data in data['venues'].items():
-            concert_count = len(venue_data['concerts'])
+            concert_count = len(venue_data.get('concert_ids', venue_data.get('concerts', [])))
             print(f"   {venue_data['venue_name']}: {concert_count} concerts")
         
         print(f"\n✅ Test completed successfully!")
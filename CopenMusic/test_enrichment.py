@@ -0,0 +1,50 @@
+"""
+Tests for merging event-page details into listing concerts.
+Run with: python -m pytest test_enrichment.py
+"""
+
+from bs4 import BeautifulSoup
+
+from scrapers.kb_hallen_scraper_simple import KbHallenScraper
+from scrapers.pumpehuset_scraper import PumpehusetScraper
+
+EVENT_PAGE = """
+<html><body>
+<h1>Bear Garden</h1>
+<div class="ticket-status">Udsolgt</div>
+<aside><div class="status">Få billetter</div></aside>
+</body></html>
+"""
+
+OFFERS_PAGE = """
+<html><head><script type="application/ld+json">
+{"@type": "MusicEvent", "offers": {"availability": "https://schema.org/LimitedAvailability"}}
+</script></head><body></body></html>
+"""
+
+
+def _enrich(scraper_class, listing_status, page):
+    scraper = scraper_class({'cache': {}, 'enrichment': {'status_selector': '.ticket-status, .status'}})
+    concert = scraper.normalize_data({
+        'name': 'Bear Garden', 'date': '2026-03-27', 'time': '20:00',
+        'status': listing_status, 'url': 'https://example.dk/event/bear-garden/',
+    })
+    details = scraper.parse_event_page(BeautifulSoup(page, 'lxml'))
+    scraper._apply_details([concert], {concert.url: (details, 'parsed')})
+    return concert
+
+
+def test_element_status_replaces_placeholder():
+    concert = _enrich(PumpehusetScraper, PumpehusetScraper.default_status, EVENT_PAGE)
+    # The ticket element wins over the placeholder, the aside is ignored
+    assert concert.status == 'sold_out'
+
+
+def test_element_status_keeps_listed_status():
+    concert = _enrich(KbHallenScraper, 'Venteliste', EVENT_PAGE)
+    assert concert.status == 'waiting_list'
+
+
+def test_offers_status_replaces_listed_status():
+    concert = _enrich(KbHallenScraper, 'Venteliste', OFFERS_PAGE)
+    assert concert.status == 'few_tickets'
@@ -0,0 +1,49 @@
+"""
+Tests for the K.B. Hallen scraper used by main.py (kb_hallen_scraper_simple).
+Run with: python -m pytest test_kb_hallen_scraper.py
+"""
+
+from scrapers.kb_hallen_scraper_simple import KbHallenScraper
+
+CALENDAR_PAGE = """
+<html><body>
+<div class="list-month">
+  <h2>August 2027</h2>
+  <div>25.Onsdag &mdash; 20:00 Zach Top With special guest: Wyatt Mccubbin</div>
+  <div>28.Lørdag &mdash; 10:00 Loppemarked</div>
+</div>
+<div class="list-month">
+  <h2>September 2027</h2>
+  <div>11.Lørdag &mdash; 20:00 Big Thief</div>
+</div>
+</body></html>
+"""
+
+
+def _scraper() -> KbHallenScraper:
+    return KbHallenScraper({'venue_id': 'kb_hallen', 'url': 'https://kbhallen.dk/kalender/', 'cache': {}})
+
+
+def _dates_by_name():
+    scraper = _scraper()
+    concerts = scraper.parse_concerts(scraper.parse_html(CALENDAR_PAGE.encode('utf-8')))
+    dates = {}
+    for concert in concerts:
+        dates.setdefault(concert['name'], []).append(concert['date'])
+    return dates
+
+
+def test_dates_use_month_header_year():
+    dates = _dates_by_name()
+    # A forward search from today would pick the nearest matching month instead
+    assert dates['Zach Top'] == ['2027-08-25']
+    assert dates['Big Thief'] == ['2027-09-11']
+    assert '2027-08-28' in dates['Loppemarked']
+
+
+def test_entry_reference_requires_matching_block():
+    scraper = _scraper()
+    listed_entries = {(25, 'onsdag'): [('zach top with special guest', (2027, 8))]}
+    assert scraper._entry_reference(listed_entries, 'Zach Top', '25', 'Onsdag') == (2027, 8)
+    assert scraper._entry_reference(listed_entries, 'Zach Top', '26', 'Torsdag') is None
+    assert scraper._entry_reference(listed_entries, 'Big Thief', '25', 'Onsdag') is None
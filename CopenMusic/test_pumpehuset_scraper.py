@@ -0,0 +1,37 @@
+"""
+Tests for the Pumpehuset scraper.
+Run with: python -m pytest test_pumpehuset_scraper.py
+"""
+
+from scrapers.pumpehuset_scraper import PumpehusetScraper
+
+PROGRAM_PAGE = """
+<html><head><script>var x = 1;</script></head><body>
+<section>
+  <div class="single-event-banner-text"><span>27. mar 2026</span></div>
+  <h3>Bear Garden</h3>
+</section>
+<a href="/event/big-thief/">
+  <div class="single-event-banner-text"><span>11. apr 2026</span></div>
+  Big Thief
+</a>
+</body></html>
+"""
+
+
+def _concerts():
+    scraper = PumpehusetScraper({'venue_id': 'pumpehuset', 'url': 'https://pumpehuset.dk/program/', 'cache': {}})
+    return scraper.parse_concerts(scraper.parse_html(PROGRAM_PAGE.encode('utf-8')))
+
+
+def test_banner_outside_link_produces_concert():
+    concerts = _concerts()
+    assert [concert['date'] for concert in concerts] == ['2026-03-27', '2026-04-11']
+    assert concerts[0]['name'] == '27. mar 2026'
+    assert concerts[0]['url'].startswith('https://pumpehuset.dk/program/?genre=')
+
+
+def test_banner_inside_link_uses_link_title():
+    concerts = _concerts()
+    assert 'Big Thief' in concerts[1]['name']
+    assert concerts[1]['url'] == 'https://pumpehuset.dk/event/big-thief/'
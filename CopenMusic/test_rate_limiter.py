@@ -0,0 +1,78 @@
+"""
+Tests for the per-host token bucket in rate_limiter.
+Run with: python -m pytest test_rate_limiter.py
+"""
+
+import pytest
+
+import rate_limiter
+from rate_limiter import TokenBucket, get_host_bucket
+from scrapers.pumpehuset_scraper import PumpehusetScraper
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', fake)
+    monkeypatch.setattr(rate_limiter, '_buckets', {})
+    return fake
+
+
+def test_burst_is_sent_without_waiting(clock):
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_waits_once_budget_is_used(clock):
+    bucket = TokenBucket(rate=0.5, capacity=2)
+    bucket.reserve()
+    bucket.reserve()
+    # Each further slot is booked one refill period after the previous one
+    assert bucket.reserve() == pytest.approx(2.0)
+    assert bucket.reserve() == pytest.approx(4.0)
+
+    # Time passing refills the budget
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_delay_between_requests_is_a_minimum_gap(clock):
+    bucket = get_host_bucket('https://example.dk/', {
+        'requests_per_minute': 600, 'delay_between_requests': 6, 'burst': 5
+    })
+    assert bucket.reserve() == 0.0
+    # Budget is left, but the gap still applies
+    assert bucket.reserve() == pytest.approx(6.0)
+
+    clock.now += 20
+    assert bucket.reserve() == 0.0
+    clock.now += 1
+    assert bucket.reserve() == pytest.approx(5.0)
+
+
+def test_scrapers_share_one_host_budget(clock):
+    config = {
+        'url': 'https://pumpehuset.dk/program/',
+        'rate_limit': {'requests_per_minute': 10, 'delay_between_requests': 0},
+        'cache': {},
+    }
+    first = PumpehusetScraper(config)
+    second = PumpehusetScraper(config)
+
+    first_bucket = first._rate_limiter('https://pumpehuset.dk/program/')
+    assert second._rate_limiter('https://PUMPEHUSET.dk/koncert/x/') is first_bucket
+    assert first_bucket.reserve() == 0.0
+    # The second scraper pays for the first one's request
+    assert second._rate_limiter('https://pumpehuset.dk/').reserve() == pytest.approx(6.0)
+    # Other hosts keep their own budget
+    assert second._rate_limiter('https://kbhallen.dk/').reserve() == 0.0